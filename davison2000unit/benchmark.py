@@ -0,0 +1,91 @@
+"""Cold import time of the package, measured in fresh interpreters
+
+Usage::
+
+    python -m davison2000unit.benchmark [--repeat 5] [--output import_times.jsonl] [--max-time 0.5]
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List, Optional
+
+# ===============================================================================
+
+# imports done by every spawned worker process, and on first use of each part
+STATEMENTS = ("import davison2000unit.tests",
+              "import davison2000unit.simulation",
+              "from davison2000unit.tests import SomaFiringFrequency",
+              "from davison2000unit.models import ReferenceMitralCell",
+              "from davison2000unit.plots import LogPlot")
+
+# dependencies that should only be loaded when actually needed
+HEAVY_MODULES = ("efel", "matplotlib", "sciunit", "neuron")
+
+_SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = [name for name in {heavy!r} if name in sys.modules
+          and type(sys.modules[name]).__name__ != "_LazyModule"]
+print(json.dumps({{"time": elapsed, "loaded": loaded}}))
+"""
+
+
+def import_time(statement: str, repeat: int = 5) -> Dict:
+    """Runs `statement` (e.g. "import davison2000unit.tests") in `repeat` new
+    Python processes, and returns its minimum and median run time (in s),
+    with the heavy dependencies (see HEAVY_MODULES) that it loaded."""
+    script = _SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)
+    times = []
+    loaded = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", script], check=True,
+                                capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        times.append(result["time"])
+        loaded = result["loaded"]
+    return {"statement": statement,
+            "min": min(times),
+            "median": statistics.median(times),
+            "loaded": loaded}
+
+
+def run_benchmark(statements: List[str] = STATEMENTS, repeat: int = 5,
+                  output: Optional[str] = None) -> List[Dict]:
+    """Measures :func:`import_time` of each of the `statements`, and appends
+    the results, with a timestamp, to the JSON lines file `output`, if given,
+    to track the import time over time."""
+    results = [import_time(statement, repeat) for statement in statements]
+    if output:
+        with open(output, "a") as f:
+            f.write(json.dumps({"timestamp": time.time(),
+                                "python": sys.version.split()[0],
+                                "results": results}) + "\n")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measures the cold import time of davison2000unit")
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters per statement")
+    parser.add_argument("--output", help="JSON lines file to which the results are appended")
+    parser.add_argument("--max-time", type=float,
+                        help="fail if 'import davison2000unit.tests' takes longer than this (in s)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(repeat=args.repeat, output=args.output)
+    for result in results:
+        print("{:<60} min {:7.3f} s   median {:7.3f} s   loaded: {}".format(
+            result["statement"], result["min"], result["median"], ", ".join(result["loaded"]) or "-"))
+    if args.max_time is not None and results[0]["min"] > args.max_time:
+        print("'{}' exceeds {} s".format(results[0]["statement"], args.max_time))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
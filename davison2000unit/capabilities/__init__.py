@@ -1,14 +1,23 @@
 """Loads all capability classes"""
 
-from os.path import dirname, basename, isfile
-import glob
+from davison2000unit.lazy import lazy_registry
 
 """
-NOTE: All capability files must have a prefix "cap_" and extension ".py".
-Only these would be loaded.
+NOTE: All capability files must have a prefix "cap_" and extension ".py", and
+each of their classes must be listed below. These are only imported when
+first accessed (e.g. as `capabilities.InjectStepCurrentGlomerulus`).
 """
-files = glob.glob(dirname(__file__)+"/cap_*.py")
-modules = [ basename(f)[:-3] for f in files if isfile(f)]
+REGISTRY = {
+    "InjectStepCurrentGlomerulus"           : "cap_InjectStepCurrentGlomerulus",
+    "InjectStepCurrentSoma"                 : "cap_InjectStepCurrentSoma",
+    "RecordMembranePotentialSoma"           : "cap_RecordMembranePotentialSoma",
+    "RecordMembranePotentialSomaBatch"      : "cap_RecordMembranePotentialSomaBatch",
+    "RecordMembranePotentialSomaStream"     : "cap_RecordMembranePotentialSomaStream",
+    "RecordMembranePotentialSomaUntilSpike" : "cap_RecordMembranePotentialSomaUntilSpike",
+    "RecordSpikeTimesSoma"                  : "cap_RecordSpikeTimesSoma",
+    "SaveRestoreState"                      : "cap_SaveRestoreState",
+    "SetIntegrationTimestep"                : "cap_SetIntegrationTimestep"
+}
 
-for module in modules:
-    exec("from .%s import *" % module)
+__all__ = list(REGISTRY)
+__getattr__, __dir__ = lazy_registry(__name__, REGISTRY)
@@ -0,0 +1,30 @@
+import sciunit
+from typing import List
+
+class RecordMembranePotentialSomaBatch(sciunit.Capability):
+    """Enables simulating several step current stimuli in a single run"""
+
+    def inject_step_current_batch(self, site: str, currents: List[dict]):
+        """Model should implement this method such as to set up one
+        independent copy of the neuron for each of the specified current
+        stimuli, each injected at the specified site: 'soma' or 'glomerulus'.
+        Each current is a dict of the form accepted by
+        :meth:`InjectStepCurrentSoma.inject_step_current_soma`, e.g.
+        .. code-block:: python
+            currents = [{'delay': 50.0, 'duration': 500.0, 'amplitude': 0.2},
+                        {'delay': 50.0, 'duration': 500.0, 'amplitude': 0.4}]
+        """
+        raise NotImplementedError()
+
+    def get_membrane_potential_soma_batch(self, tstop: float) -> List[List[List[float]]]:
+        """Run a single simulation for time 'tstop', specified in ms, of all
+        copies set up by :meth:`inject_step_current_batch` (e.g. as several
+        cells in one NEURON network, or vectorized across amplitudes), while
+        recording the membrane potential from the soma of each.
+        Must return a list with one entry per current, in the same order,
+        each of the form:
+        |    [ list1, list2 ] where,
+        |        list1 = time series (in ms)
+        |        list2 = membrane potential series (in mV)
+        """
+        raise NotImplementedError()
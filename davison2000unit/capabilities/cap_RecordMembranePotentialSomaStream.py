@@ -0,0 +1,19 @@
+import sciunit
+from typing import Iterator, List
+
+class RecordMembranePotentialSomaStream(sciunit.Capability):
+    """Enables recording membrane potential from soma in fixed-size chunks"""
+
+    def stream_membrane_potential_soma(self, tstop: float, chunk_size: int) -> Iterator[List[List[float]]]:
+        """Run simulation for time 'tstop', specified in ms, while recording
+        the membrane potential from soma, yielding the recorded samples as
+        they become available, in chunks of at most 'chunk_size' samples.
+        Only the current chunk needs to be held in memory.
+        Each chunk must be a list of the form:
+        |    [ list1, list2 ] where,
+        |        list1 = time series (in ms)
+        |        list2 = membrane potential series (in mV)
+        Chunks are consecutive, and together they form the same trace that
+        would be returned by `get_membrane_potential_soma` (if implemented).
+        """
+        raise NotImplementedError()
@@ -0,0 +1,20 @@
+import sciunit
+from typing import List
+
+class RecordMembranePotentialSomaUntilSpike(sciunit.Capability):
+    """Enables stopping the simulation at the first spike at soma"""
+
+    def get_membrane_potential_soma_until_spike(self, tstop: float, start: float) -> List[List[float]]:
+        """Run simulation while recording the membrane potential from soma,
+        but halt it as soon as the first action potential at soma after time
+        'start' (in ms) has been detected (e.g. via a NEURON NetCon event
+        that calls h.stoprun), or at time 'tstop' (in ms) if there is none.
+        Recording should continue until the membrane potential has fallen
+        back below the spike detection threshold (-20 mV), so that the spike
+        peak is part of the returned trace.
+        Must return a list of the form:
+        |    [ list1, list2 ] where,
+        |        list1 = time series (in ms)
+        |        list2 = membrane potential series (in mV)
+        """
+        raise NotImplementedError()
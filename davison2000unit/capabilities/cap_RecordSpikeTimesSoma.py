@@ -0,0 +1,16 @@
+import sciunit
+from typing import List
+
+class RecordSpikeTimesSoma(sciunit.Capability):
+    """Enables recording spike times at soma"""
+
+    def get_spike_times_soma(self, tstop: float) -> List[float]:
+        """Run simulation for time 'tstop', specified in ms, while recording
+        only the times of action potentials at the soma, e.g. via the
+        simulator's native spike detection (such as a NEURON NetCon with a
+        threshold of -20 mV), instead of the full membrane potential.
+        Must return a list of spike times (in ms), in increasing order.
+        Spikes should preferably be timed at their peak, as done by eFEL;
+        threshold crossing times give slightly shorter first spike latencies.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,24 @@
+import sciunit
+
+class SaveRestoreState(sciunit.Capability):
+    """Enables starting simulations from a saved model state"""
+
+    def save_state(self):
+        """Model should implement this method such as to return a snapshot
+        of the complete state of the model (membrane potentials, gating
+        variables, time, etc.) at the end of the last simulation, e.g. via
+        NEURON's SaveState. The snapshot is only passed back to
+        :meth:`restore_state` of the same model, within the same process.
+        """
+        raise NotImplementedError()
+
+    def restore_state(self, state):
+        """Model should implement this method such as to start the next
+        simulation from the snapshot 'state' returned by :meth:`save_state`,
+        instead of from the initial conditions, keeping the current injected
+        by the latest call to an 'inject_step_current_*' method (for models
+        with the capability RecordMembranePotentialSomaBatch, in each copy).
+        The simulation then continues from the time of the snapshot until
+        'tstop', and the returned traces start at the time of the snapshot.
+        """
+        raise NotImplementedError()
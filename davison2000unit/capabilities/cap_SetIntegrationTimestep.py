@@ -0,0 +1,16 @@
+import sciunit
+
+class SetIntegrationTimestep(sciunit.Capability):
+    """Enables changing the integration timestep of the simulations"""
+
+    def set_integration_timestep(self, dt: float):
+        """Model should implement this method such as to use a fixed
+        integration timestep of 'dt' (in ms) for subsequent simulations.
+        """
+        raise NotImplementedError()
+
+    def get_integration_timestep(self) -> float:
+        """Model should implement this method such as to return the
+        integration timestep (in ms) currently in use.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,118 @@
+"""Incremental checkpointing of the simulated stimuli, to resume interrupted runs"""
+
+import os
+import json
+import numpy
+from typing import Dict, Tuple
+
+# ===============================================================================
+
+
+def _normalized(data):
+    # as read back from JSON, for comparison with the records
+    return json.loads(json.dumps(data, default=str))
+
+
+class Checkpoint:
+    """
+    Append-only record of the stimuli simulated so far by a test
+
+    Each completed stimulus is appended as one line to a JSONL file,
+    holding its protocol, run time and the name of an NPZ file with its
+    trace (or, for runs recording only spike times, the spike times
+    themselves). The line is only written once the NPZ file is complete, and
+    is flushed to disk immediately, so that an interrupted run loses at most
+    the stimulus being simulated. A line that was only partially written is
+    ignored when the checkpoint is loaded.
+
+    Examples
+    --------
+    >>> test = SomaFiringFrequency(observation=obs, resume=True)
+    >>> score = test.judge(model)   # interrupted, then run again: only missing stimuli are simulated
+    """
+
+    def __init__(self, path: str, model_id: dict):
+        self.path = path
+        self.model_id = _normalized(model_id)
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+    def _data_path(self, stim: float) -> str:
+        return "{}_{}.npz".format(self.path[:-len(".jsonl")], stim)
+
+    def _records(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # partially written line of an interrupted run
+                    continue
+
+    def append(self, stim: float, protocol: Tuple[str, dict, float], output: Tuple) -> None:
+        """Records the `output` (eFEL trace, run time, trace) of stimulus `stim`,
+        simulated with `protocol` (site, current, tstop). The run time is None
+        for stimuli served from a cache."""
+        efel_trace, run_time, trace = output
+        record = {"stim": stim,
+                  "model": self.model_id,
+                  "protocol": _normalized(list(protocol)),
+                  "run_time": run_time,
+                  "stim_start": efel_trace["stim_start"][0],
+                  "stim_end": efel_trace["stim_end"][0],
+                  "has_trace": trace is not None}
+        if "T" in efel_trace:
+            data_path = self._data_path(stim)
+            tmp_path = data_path[:-len(".npz")] + ".tmp.npz"
+            numpy.savez(tmp_path, t=numpy.asarray(efel_trace["T"], dtype=float),
+                        v=numpy.asarray(efel_trace["V"], dtype=float))
+            os.replace(tmp_path, data_path)
+            record["data_file"] = os.path.basename(data_path)
+        else:
+            record["spike_times"] = list(map(float, efel_trace["spike_times"]))
+
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load(self, protocols: Dict[float, Tuple[str, dict, float]]) -> Dict[float, Tuple]:
+        """Returns the recorded outputs {stim: (eFEL trace, run time, trace)}
+        of the stimuli in `protocols` ({stim: (site, current, tstop)}).
+        Records of another model or protocol are ignored."""
+        outputs = {}
+        for record in self._records():
+            stim = record.get("stim")
+            if stim not in protocols or record.get("model") != self.model_id:
+                continue
+            if record.get("protocol") != _normalized(list(protocols[stim])):
+                continue
+            efel_trace = {'stim_start' : [record["stim_start"]],
+                          'stim_end'   : [record["stim_end"]]}
+            trace = None
+            if "data_file" in record:
+                try:
+                    with numpy.load(os.path.join(os.path.dirname(self.path), record["data_file"])) as data:
+                        efel_trace['T'] = data["t"]
+                        efel_trace['V'] = data["v"]
+                except (OSError, KeyError, ValueError):
+                    continue
+                if record["has_trace"]:
+                    trace = {"stim": stim, "t": efel_trace['T'], "v": efel_trace['V']}
+            else:
+                efel_trace['spike_times'] = record["spike_times"]
+            outputs[stim] = (efel_trace, record["run_time"], trace)
+        return outputs
+
+    def remove(self) -> None:
+        """Deletes the checkpoint, e.g. once the test has completed."""
+        for record in self._records():
+            if "data_file" in record:
+                data_path = os.path.join(os.path.dirname(self.path), record["data_file"])
+                if os.path.exists(data_path):
+                    os.remove(data_path)
+        if os.path.exists(self.path):
+            os.remove(self.path)
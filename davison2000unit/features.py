@@ -0,0 +1,173 @@
+"""NumPy implementations of the eFEL features used by the tests"""
+
+import numpy
+from typing import Dict, List, Optional
+
+# ===============================================================================
+
+THRESHOLD = -20.0   # mV, same as eFEL's default 'Threshold'
+INTERP_STEP = 0.1   # ms, same as eFEL's default 'interp_step'
+REFRACTORY = 1.0    # ms, minimum interval between two detected spikes
+
+FEATURES = ("Spikecount_stimint", "time_to_first_spike")
+
+
+def spike_times(t, v, threshold: float = THRESHOLD, refractory: float = REFRACTORY) -> numpy.ndarray:
+    """Returns the times (in ms) of the action potential peaks in a Vm trace.
+
+    A spike is detected at each upward crossing of `threshold` that is
+    followed by a downward crossing, and is timed at the maximum of Vm
+    between the two. Upward crossings within `refractory` ms of the previous
+    one are ignored.
+    """
+    t = numpy.asarray(t, dtype=float)
+    v = numpy.asarray(v, dtype=float)
+    above = v >= threshold
+    ups = numpy.flatnonzero(~above[:-1] & above[1:]) + 1
+    downs = numpy.flatnonzero(above[:-1] & ~above[1:]) + 1
+
+    # pair each upward crossing with the next downward crossing
+    down_ind = numpy.searchsorted(downs, ups, side="right")
+    complete = down_ind < len(downs)
+    ups = ups[complete]
+    downs = downs[down_ind[complete]]
+    if len(ups) == 0:
+        return numpy.empty(0)
+
+    # refractory guard
+    keep = numpy.ones(len(ups), dtype=bool)
+    keep[1:] = numpy.diff(t[ups]) >= refractory
+    ups = ups[keep]
+    downs = downs[keep]
+
+    # index of the (first) maximum of Vm within each [up, down) segment
+    lengths = downs - ups
+    seg_start = numpy.cumsum(lengths) - lengths
+    seg = numpy.repeat(numpy.arange(len(ups)), lengths)
+    pos = numpy.arange(lengths.sum()) - numpy.repeat(seg_start, lengths) + numpy.repeat(ups, lengths)
+    order = numpy.lexsort((-v[pos], seg))
+    peaks = pos[order[seg_start]]
+    return t[peaks]
+
+
+def get_feature_values(efel_traces: List[Dict], feature: str,
+                       threshold: float = THRESHOLD, refractory: float = REFRACTORY,
+                       interp_step: Optional[float] = INTERP_STEP) -> List[Optional[float]]:
+    """Computes `feature` for each of the `efel_traces` (in eFEL format).
+
+    Supports the eFEL features 'Spikecount_stimint' (number of spikes within
+    [stim_start, stim_end]) and 'time_to_first_spike' (time from stim_start
+    to the first spike; None if there is no spike after stim_start). Unlike
+    eFEL, which times the first spike of the whole trace, spikes preceding
+    stim_start are ignored. As in eFEL, traces are first linearly resampled
+    every `interp_step` ms; set it to None to detect spikes on the recorded
+    samples instead.
+    Traces may also hold already detected 'spike_times' instead of 'T'/'V'.
+    """
+    if feature not in FEATURES:
+        raise ValueError("Feature '{}' is not supported; must be one of {}".format(feature, FEATURES))
+
+    values = []
+    for trace in efel_traces:
+        if "spike_times" in trace:
+            peaks = numpy.asarray(trace["spike_times"], dtype=float)
+        else:
+            t = numpy.asarray(trace["T"], dtype=float)
+            v = numpy.asarray(trace["V"], dtype=float)
+            if interp_step and len(t) > 1:
+                t_interp = numpy.arange(t[0], t[-1] + interp_step / 2, interp_step)
+                v = numpy.interp(t_interp, t, v)
+                t = t_interp
+            peaks = spike_times(t, v, threshold, refractory)
+        stim_start = trace["stim_start"][0]
+        stim_end = trace["stim_end"][0]
+        if feature == "Spikecount_stimint":
+            values.append(int(numpy.count_nonzero((peaks >= stim_start) & (peaks <= stim_end))))
+        else:
+            peaks = peaks[peaks >= stim_start]
+            values.append(float(peaks[0] - stim_start) if len(peaks) else None)
+    return values
+
+# ===============================================================================
+
+
+class OnlineSpikeFeatures:
+    """
+    Accumulates spike features from a Vm trace received in consecutive chunks
+
+    Spikes are detected as in :func:`spike_times` (without resampling), with
+    the detector state carried over between chunks, so that memory use does
+    not depend on the length of the trace.
+
+    Examples
+    --------
+    >>> spike_features = features.OnlineSpikeFeatures(stim_start=50.0, stim_end=550.0)
+    >>> for t_chunk, v_chunk in model.stream_membrane_potential_soma(tstop=550.0, chunk_size=10000):
+    ...     spike_features.update(t_chunk, v_chunk)
+    >>> spike_features.spike_count, spike_features.time_to_first_spike
+    """
+
+    def __init__(self, stim_start: float, stim_end: float,
+                 threshold: float = THRESHOLD, refractory: float = REFRACTORY):
+        self.stim_start = stim_start
+        self.stim_end = stim_end
+        self.threshold = threshold
+        self.refractory = refractory
+        self.spike_count = 0            # spikes within [stim_start, stim_end]
+        self.first_spike_time = None    # time of first spike after stim_start
+        self.n_samples = 0
+        self._above = None              # state of the last sample received
+        self._last_up = -numpy.inf      # time of the last upward crossing
+        self._in_spike = False          # within a spike that is to be counted
+        self._peak_v = -numpy.inf
+        self._peak_t = None
+
+    @property
+    def time_to_first_spike(self) -> Optional[float]:
+        if self.first_spike_time is None:
+            return None
+        return self.first_spike_time - self.stim_start
+
+    def _update_peak(self, t, v, start, stop):
+        if self._in_spike and stop > start:
+            ind = start + int(numpy.argmax(v[start:stop]))
+            if v[ind] > self._peak_v:
+                self._peak_v = v[ind]
+                self._peak_t = float(t[ind])
+
+    def _end_spike(self):
+        if self.stim_start <= self._peak_t <= self.stim_end:
+            self.spike_count += 1
+        if self.first_spike_time is None and self._peak_t >= self.stim_start:
+            self.first_spike_time = self._peak_t
+        self._in_spike = False
+
+    def update(self, t, v) -> None:
+        """Consumes the next chunk (t, v) of the trace."""
+        t = numpy.asarray(t, dtype=float)
+        v = numpy.asarray(v, dtype=float)
+        if len(v) == 0:
+            return
+        above = v >= self.threshold
+        prev = numpy.empty_like(above)
+        prev[0] = above[0] if self._above is None else self._above
+        prev[1:] = above[:-1]
+        crossings = numpy.flatnonzero(prev != above)
+
+        # only crossings need to be handled one at a time
+        pos = 0
+        for ind in crossings:
+            if above[ind]:
+                keep = t[ind] - self._last_up >= self.refractory
+                self._last_up = t[ind]
+                if keep:
+                    self._in_spike = True
+                    self._peak_v = -numpy.inf
+                    pos = ind
+            else:
+                if self._in_spike:
+                    self._update_peak(t, v, pos, ind)
+                    self._end_spike()
+        self._update_peak(t, v, pos, len(v))
+        self._above = above[-1]
+        self.n_samples += len(v)
@@ -0,0 +1,86 @@
+"""Deferred rendering of the test figures in background processes"""
+
+import os
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import List, Optional, Union
+
+# ===============================================================================
+
+_executor = None
+_pending = []
+
+
+def _get_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 'spawn' avoids inheriting the simulator state of the parent
+        _executor = ProcessPoolExecutor(max_workers=max_workers,
+                                        mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+def _snapshot(plot):
+    """Returns a copy of `plot` holding only the data its `save_file` needs,
+    so that it can be sent to a worker process without the model."""
+    test = plot.score.test
+    score = SimpleNamespace(score=plot.score.score,
+                            observation=plot.score.observation,
+                            prediction=plot.score.prediction,
+                            test=SimpleNamespace(target_dir=test.target_dir,
+                                                 traces=getattr(test, "traces", [])))
+    return type(plot)(name=plot.filename, score=score, params=plot.params)
+
+
+def _save_file(plot) -> str:
+    return plot.save_file()
+
+
+def save_figure(plot, defer: bool = False) -> Union[str, Future]:
+    """Renders `plot` (e.g. a :class:`plots.LogPlot`) to file.
+
+    If `defer` is True, rendering is queued to a background process pool and
+    a Future of the file path is returned instead of the path itself; call
+    :func:`wait_for_figures` to make sure all queued figures are written.
+    """
+    if not defer:
+        return plot.save_file()
+    future = _get_executor().submit(_save_file, _snapshot(plot))
+    # path the figure will be written to, known before rendering completes
+    future.filepath = os.path.join(plot.score.test.target_dir, plot.filename + '.pdf')
+    _pending.append(future)
+    return future
+
+
+def wait_for_figures(scores: Optional[List] = None) -> List[str]:
+    """Waits for all deferred figures to be written.
+
+     Parameters
+     ----------
+     scores : list
+         optional list of scores (or a single score) whose
+         related_data["figures"] entries are to be replaced by file paths
+
+     Returns
+     -------
+     list
+         The absolute paths of all figures written since the last call
+
+     Examples
+     --------
+     >>> score = SomaFiringFrequency(observation=obs, defer_figures=True).judge(model)
+     >>> figures.wait_for_figures(score)
+     """
+    global _pending
+    pending, _pending = _pending, []
+    paths = [future.result() for future in pending]
+
+    if scores is not None:
+        if not isinstance(scores, (list, tuple)):
+            scores = [scores]
+        for score in scores:
+            related_figures = score.related_data.get("figures", [])
+            score.related_data["figures"] = [entry.result() if isinstance(entry, Future) else entry
+                                             for entry in related_figures]
+    return paths
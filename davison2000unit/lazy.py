@@ -0,0 +1,65 @@
+"""Lazy loading of the classes of each subpackage and of heavy dependencies,
+so that importing the package (e.g. in every spawned worker process) only
+pays for what is actually used"""
+
+import sys
+import importlib
+import importlib.util
+from typing import Callable, Dict, Tuple
+
+# ===============================================================================
+
+
+def lazy_import(name: str):
+    """Returns module `name`, which is only executed on first attribute
+    access, e.g. ``efel = lazy_import("efel")`` defers the import of eFEL
+    until a feature is actually extracted."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError("No module named '{}'".format(name), name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    if "." in name:
+        # as done by the import system, so that e.g. `importlib.metadata` works
+        parent, _, child = name.rpartition(".")
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+# reading the metadata of the installed packages is deferred until a name is
+# not found among the built-in classes
+plugins = lazy_import("davison2000unit.plugins")
+
+
+def lazy_registry(package: str, registry: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """Returns the module-level ``__getattr__`` and ``__dir__`` functions of
+    subpackage `package`, such that each name in `registry` ({name: module})
+    is imported from its module only when first accessed. Other names are
+    looked up among the plugins registered in the entry point group named
+    `package` (see :mod:`davison2000unit.plugins`).
+
+     Examples
+     --------
+     >>> REGISTRY = {"RMSscore": "score_RMS"}
+     >>> __getattr__, __dir__ = lazy_registry(__name__, REGISTRY)
+     """
+    def __getattr__(name):
+        if name in registry:
+            value = getattr(importlib.import_module("." + registry[name], package), name)
+        elif not name.startswith("__") and name in plugins.entry_points(package):
+            value = plugins.load(package, name)
+        else:
+            raise AttributeError("module '{}' has no attribute '{}'".format(package, name))
+        # later lookups no longer go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(registry) | set(plugins.entry_points(package)))
+
+    return __getattr__, __dir__
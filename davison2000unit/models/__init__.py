@@ -0,0 +1,15 @@
+"""Loads all model classes"""
+
+from davison2000unit.lazy import lazy_registry
+
+"""
+NOTE: All model files must have a prefix "model_" and extension ".py", and
+each of their classes must be listed below. These are only imported when
+first accessed (e.g. as `models.ReferenceMitralCell`).
+"""
+REGISTRY = {
+    "ReferenceMitralCell" : "model_ReferenceMitralCell"
+}
+
+__all__ = list(REGISTRY)
+__getattr__, __dir__ = lazy_registry(__name__, REGISTRY)
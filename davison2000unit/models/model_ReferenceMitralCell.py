@@ -0,0 +1,254 @@
+import numpy
+import sciunit
+import davison2000unit.capabilities as cap
+import davison2000unit.features as features
+from typing import Iterator, List, Tuple
+
+# ===============================================================================
+
+E_NA = 50.0     # mV
+E_K = -77.0     # mV
+E_LEAK = -54.4  # mV
+V_INIT = -65.0  # mV
+CM = 1.0        # uF/cm2
+
+SOMA_AREA = 2.5e-5          # cm2
+DENDRITE_AREA = 5.0e-5      # cm2, primary dendrite, divided among its compartments
+GLOMERULUS_AREA = 2.0e-5    # cm2, glomerular tuft
+AXIAL_CONDUCTANCE = 0.05    # uS, between soma and glomerulus
+
+# maximal conductances (mS/cm2) of Na, K (delayed rectifier) and leak channels
+SOMA_CONDUCTANCES = (120.0, 36.0, 0.3)
+DENDRITE_CONDUCTANCES = (40.0, 12.0, 0.3)
+
+# gating rates are tabulated over this range of Vm (in mV), and linearly
+# interpolated, as done by NEURON's TABLE statement
+V_TABLE_MIN = -150.0
+V_TABLE_MAX = 100.0
+V_TABLE_STEP = 0.05
+
+
+def _vtrap(x, y):
+    # x / (exp(x/y) - 1), continued by its limit y at x = 0
+    ratio = x / y
+    small = numpy.abs(ratio) < 1e-6
+    return numpy.where(small, y * (1.0 - ratio / 2.0), x / numpy.expm1(numpy.where(small, 1.0, ratio)))
+
+
+def _rates(v):
+    """Returns the opening and closing rates (1/ms) of the gates m, h and n."""
+    return ((0.1 * _vtrap(-(v + 40.0), 10.0), 4.0 * numpy.exp(-(v + 65.0) / 18.0)),
+            (0.07 * numpy.exp(-(v + 65.0) / 20.0), 1.0 / (1.0 + numpy.exp(-(v + 35.0) / 10.0))),
+            (0.01 * _vtrap(-(v + 55.0), 10.0), 0.125 * numpy.exp(-(v + 65.0) / 80.0)))
+
+
+class ReferenceMitralCell(sciunit.Model,
+                          cap.InjectStepCurrentSoma,
+                          cap.InjectStepCurrentGlomerulus,
+                          cap.RecordMembranePotentialSoma,
+                          cap.RecordMembranePotentialSomaBatch,
+                          cap.RecordMembranePotentialSomaStream,
+                          cap.RecordMembranePotentialSomaUntilSpike,
+                          cap.RecordSpikeTimesSoma,
+                          cap.SaveRestoreState,
+                          cap.SetIntegrationTimestep):
+    """
+    Reduced multi-compartment mitral cell model, simulated with NumPy
+
+    The cell is a chain of `n_compartments` compartments: the soma, the
+    primary dendrite (divided into `n_compartments` - 2 compartments) and
+    the glomerular tuft, each with Hodgkin-Huxley Na, K and leak channels.
+    It is integrated with a fixed timestep (backward Euler for the membrane
+    potentials, exponential Euler for the gates), vectorized across all
+    stimuli of a batch.
+
+    This is not a model from Davison et al., 2000, but a deterministic,
+    dependency-free stand-in to run and benchmark the tests, scores and
+    plots without NEURON. Set `n_compartments` to 2, 3, 4 or more to mimic
+    the computational cost of the 2C, 3C, 4C and Full models. Traces are
+    returned as numpy arrays.
+
+    Examples
+    --------
+    >>> model = models.ReferenceMitralCell(n_compartments=4)
+    >>> score = tests.SomaFiringFrequency(observation=obs).judge(model)
+    """
+
+    def __init__(self, name: str = None, n_compartments: int = 2, dt: float = 0.025):
+        if n_compartments < 2:
+            raise ValueError("'n_compartments' must be at least 2 (soma and glomerulus)!")
+        # as sciunit params, so that they are part of the model identity hashed by
+        # simulation.DiskCache and checkpoint.Checkpoint
+        sciunit.Model.__init__(self, name=name or "Reference Mitral Cell ({}C)".format(n_compartments),
+                               n_compartments=n_compartments, dt=dt)
+        self.n_compartments = n_compartments
+        self.dt = dt
+        self.stimuli = []   # list of (site, current) of the cells to be simulated
+        self.state = None           # (step, dt, v, gates) at the end of the last simulation
+        self.initial_state = None   # state to start the next simulation from
+
+        n_dendrite = n_compartments - 2
+        areas = [SOMA_AREA] + [DENDRITE_AREA / max(n_dendrite, 1)] * n_dendrite + [GLOMERULUS_AREA]
+        self.areas = numpy.array(areas)
+        conductances = numpy.array([SOMA_CONDUCTANCES] + [DENDRITE_CONDUCTANCES] * (n_compartments - 1))
+        self.g_max = conductances.T * self.areas * 1e3      # uS, rows: Na, K, leak
+        self.capacitance = CM * self.areas * 1e3            # nF
+        # conductance of each link of the chain, such that the total axial
+        # resistance between soma and glomerulus does not depend on n_compartments
+        self.g_axial = AXIAL_CONDUCTANCE * (n_compartments - 1)
+
+    # ----------------------------------------------------------------------
+
+    def inject_step_current_soma(self, current: dict):
+        self.stimuli = [("soma", current)]
+
+    def inject_step_current_glomerulus(self, current: dict):
+        self.stimuli = [("glomerulus", current)]
+
+    def inject_step_current_batch(self, site: str, currents: List[dict]):
+        self.stimuli = [(site, current) for current in currents]
+
+    def set_integration_timestep(self, dt: float):
+        self.dt = dt
+        self.params["dt"] = dt
+
+    def get_integration_timestep(self) -> float:
+        return self.dt
+
+    def save_state(self):
+        if self.state is None:
+            raise ValueError("No state to save! Please run a simulation first.")
+        return self.state
+
+    def restore_state(self, state):
+        self.initial_state = state
+
+    # ----------------------------------------------------------------------
+
+    def simulate(self, tstop: float, chunk_size: int = None) -> Iterator[Tuple[numpy.ndarray, numpy.ndarray]]:
+        """Simulates all cells in `self.stimuli` for time `tstop` (in ms),
+        yielding the somatic Vm in consecutive chunks of at most `chunk_size`
+        samples (default: a single chunk), as tuples of (t, V) with t of shape
+        (n_samples,) and V of shape (n_cells, n_samples). The simulation starts
+        from the state passed to :meth:`restore_state`, if any, and otherwise
+        from rest."""
+        if not self.stimuli:
+            raise ValueError("No stimulus specified! Please inject a current first.")
+        dt = self.dt
+        n_steps = int(round(tstop / dt))
+        if not chunk_size:
+            chunk_size = n_steps + 1
+        n_cells = len(self.stimuli)
+        n = self.n_compartments
+        cells = numpy.arange(n_cells)
+        sites = numpy.array([0 if site == "soma" else n - 1 for site, _ in self.stimuli])
+        for site, _ in self.stimuli:
+            if site not in ("soma", "glomerulus"):
+                raise ValueError("Unknown stimulus site '{}'!".format(site))
+        stim_start = numpy.array([current["delay"] for _, current in self.stimuli])
+        stim_stop = stim_start + numpy.array([current["duration"] for _, current in self.stimuli])
+        amplitude = numpy.array([current["amplitude"] for _, current in self.stimuli])
+
+        # steady state values and decay factors over one timestep of the gates m, h, n
+        v_table = numpy.arange(V_TABLE_MIN, V_TABLE_MAX + V_TABLE_STEP, V_TABLE_STEP)
+        rates = numpy.array(_rates(v_table))    # (gate, alpha/beta, v)
+        inf_table = rates[:, 0] / (rates[:, 0] + rates[:, 1])
+        decay_table = numpy.exp(-dt * (rates[:, 0] + rates[:, 1]))
+        inf_slope = numpy.diff(inf_table, append=inf_table[:, -1:], axis=1)
+        decay_slope = numpy.diff(decay_table, append=decay_table[:, -1:], axis=1)
+        max_index = len(v_table) - 1
+
+        first_step = 0
+        if self.initial_state is not None:
+            first_step, state_dt, state_v, state_gates = self.initial_state
+            self.initial_state = None
+            if state_dt != dt:
+                raise ValueError("The restored state was saved with another integration timestep!")
+            v = numpy.broadcast_to(state_v[:1], (n_cells, n)).copy()
+            gates = numpy.broadcast_to(state_gates[:, :1], (3, n_cells, n)).copy()
+        else:
+            v = numpy.full((n_cells, n), V_INIT)
+            alpha, beta = numpy.array(_rates(v)).transpose(1, 0, 2, 3)
+            gates = alpha / (alpha + beta)      # (gate, cell, compartment)
+        g_na_max, g_k_max, g_leak = self.g_max
+        c_dt = self.capacitance / dt
+        g_link = self.g_axial
+        g_link_sum = numpy.full(n, 2.0 * g_link)
+        g_link_sum[[0, -1]] = g_link
+        current_inj = numpy.zeros((n_cells, n))
+
+        t_chunk = numpy.empty(chunk_size)
+        v_chunk = numpy.empty((n_cells, chunk_size))
+        t_chunk[0] = first_step * dt
+        v_chunk[:, 0] = v[:, 0]
+        pos = 1
+        step = first_step
+        try:
+            for step in range(first_step + 1, n_steps + 1):
+                t = (step - 1) * dt
+                # gates (exponential Euler)
+                x = (v - V_TABLE_MIN) / V_TABLE_STEP
+                numpy.minimum(numpy.maximum(x, 0, out=x), max_index, out=x)
+                ind = x.astype(int)
+                frac = x - ind
+                gate_inf = inf_table[:, ind] + frac * inf_slope[:, ind]
+                gates = gate_inf + (gates - gate_inf) * (decay_table[:, ind] + frac * decay_slope[:, ind])
+                m, h, n_gate = gates
+                g_na = g_na_max * (m * m * m * h)
+                n_gate = n_gate * n_gate
+                g_k = g_k_max * (n_gate * n_gate)
+                current_inj[cells, sites] = amplitude * ((stim_start <= t) & (t < stim_stop))
+
+                # membrane potentials (backward Euler): tridiagonal system solved by the Thomas algorithm
+                diag = c_dt + g_na + g_k + g_leak + g_link_sum
+                rhs = c_dt * v + g_na * E_NA + g_k * E_K + g_leak * E_LEAK + current_inj
+                for k in range(1, n):
+                    ratio = g_link / diag[:, k-1]
+                    diag[:, k] -= ratio * g_link
+                    rhs[:, k] += ratio * rhs[:, k-1]
+                v[:, n-1] = rhs[:, n-1] / diag[:, n-1]
+                for k in range(n - 2, -1, -1):
+                    v[:, k] = (rhs[:, k] + g_link * v[:, k+1]) / diag[:, k]
+
+                if pos == chunk_size:
+                    yield t_chunk.copy(), v_chunk.copy()
+                    pos = 0
+                t_chunk[pos] = step * dt
+                v_chunk[:, pos] = v[:, 0]
+                pos += 1
+            yield t_chunk[:pos].copy(), v_chunk[:, :pos].copy()
+        finally:
+            # also reached when the caller stops early (see get_membrane_potential_soma_until_spike)
+            self.state = (step, dt, v.copy(), gates.copy())
+
+    # ----------------------------------------------------------------------
+
+    def get_membrane_potential_soma(self, tstop: float):
+        t, v = next(self.simulate(tstop))
+        return [t, v[0]]
+
+    def get_membrane_potential_soma_batch(self, tstop: float):
+        t, v = next(self.simulate(tstop))
+        return [[t, v_cell] for v_cell in v]
+
+    def stream_membrane_potential_soma(self, tstop: float, chunk_size: int):
+        for t, v in self.simulate(tstop, chunk_size):
+            yield [t, v[0]]
+
+    def get_spike_times_soma(self, tstop: float) -> List[float]:
+        t, v = self.get_membrane_potential_soma(tstop)
+        return features.spike_times(t, v).tolist()
+
+    def get_membrane_potential_soma_until_spike(self, tstop: float, start: float):
+        # advance in chunks of 1 ms, until the first spike after 'start' has ended
+        chunk_size = max(1, int(round(1.0 / self.dt)))
+        spike_features = features.OnlineSpikeFeatures(stim_start=start, stim_end=tstop)
+        list_t = []
+        list_v = []
+        for t, v in self.simulate(tstop, chunk_size):
+            list_t.append(t)
+            list_v.append(v[0])
+            spike_features.update(t, v[0])
+            if spike_features.first_spike_time is not None:
+                break
+        return [numpy.concatenate(list_t), numpy.concatenate(list_v)]
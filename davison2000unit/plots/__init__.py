@@ -1,14 +1,18 @@
 """Loads all plot classes"""
 
-from os.path import dirname, basename, isfile
-import glob
+from davison2000unit.lazy import lazy_registry
 
 """
-NOTE: All plot files must have a prefix "plot_" and extension ".py".
-Only these would be loaded.
+NOTE: All plot files must have a prefix "plot_" and extension ".py", and
+each of their classes must be listed below. These are only imported when
+first accessed (e.g. as `plots.LogPlot`).
 """
-files = glob.glob(dirname(__file__)+"/plot_*.py")
-modules = [ basename(f)[:-3] for f in files if isfile(f)]
+REGISTRY = {
+    "LogPlot"         : "plot_logplot",
+    "ParetoPlot"      : "plot_pareto",
+    "Traces"          : "plot_traces",
+    "decimate_minmax" : "plot_traces"
+}
 
-for module in modules:
-    exec("from .%s import *" % module)
+__all__ = list(REGISTRY)
+__getattr__, __dir__ = lazy_registry(__name__, REGISTRY)
@@ -0,0 +1,56 @@
+import os
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# ==============================================================================
+
+
+class ParetoPlot:
+    """
+    Creates a plot of 'Run time' vs 'Error' for simulations run at various
+    integration timesteps, highlighting the Pareto-optimal timesteps
+    """
+
+    def __init__(self, name="pareto_plot", score=None, params={}):
+        self.filename = name
+        self.score = score
+        self.params = params
+
+    def save_file(self):
+        fig = Figure(figsize=(10, 7))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+
+        data = self.score.prediction
+        dt_list = sorted(data.keys())
+        run_times = [data[dt]["run_time"] for dt in dt_list]
+        errors = [data[dt]["rms_vs_finest"] for dt in dt_list]
+
+        # a timestep is Pareto-optimal if no other timestep is both faster and more accurate
+        front = [dt for dt in dt_list
+                 if not any(data[other]["run_time"] <= data[dt]["run_time"]
+                            and data[other]["rms_vs_finest"] <= data[dt]["rms_vs_finest"]
+                            and other != dt for other in dt_list)]
+        front = sorted(front, key=lambda dt: data[dt]["run_time"])
+        ax.plot([data[dt]["run_time"] for dt in front], [data[dt]["rms_vs_finest"] for dt in front],
+                 'r', linestyle='--', label="Pareto front")
+        ax.plot(run_times, errors, 'b', marker='o', markersize=8, linestyle='None', label="Timesteps")
+        for dt, run_time, error in zip(dt_list, run_times, errors):
+            ax.annotate("dt = {} ms".format(dt), xy=(run_time, error), xytext=(8, 8),
+                         textcoords='offset points', size=12)
+
+        title = self.params["title"] if "title" in self.params else "Timestep Convergence"
+        fig.suptitle(title, fontsize=20, fontweight='bold', y=1.035)
+        xlabel = self.params["xlabel"] if "xlabel" in self.params else None
+        if xlabel:
+            ax.set_xlabel(xlabel, fontsize=18)
+        ylabel = self.params["ylabel"] if "ylabel" in self.params else None
+        if ylabel:
+            ax.set_ylabel(ylabel, fontsize=18)
+        ax.tick_params(axis='both', which='major', labelsize=14)
+        ax.legend(loc="best", prop={'size': 14})
+
+        fig.tight_layout()
+        filepath = os.path.join(self.score.test.target_dir, self.filename + '.pdf')
+        fig.savefig(filepath, dpi=600, bbox_inches = "tight")
+        return filepath
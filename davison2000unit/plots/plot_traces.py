@@ -1,8 +1,41 @@
 import os
-import matplotlib
-# Force matplotlib to not use any Xwindows backend.
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+import numpy
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# ==============================================================================
+
+
+def decimate_minmax(t, v, max_points=5000):
+    """Reduces a trace to at most about `max_points` samples for plotting.
+
+    The trace is split into `max_points`/2 consecutive bins, and only the
+    minimum and maximum of each bin are kept (in their original order), so
+    that spikes remain visually intact at any realistic figure resolution.
+    A `max_points` of 0 or None disables the decimation.
+    """
+    t = numpy.asarray(t)
+    v = numpy.asarray(v)
+    n = len(v)
+    if not max_points or n <= max_points:
+        return t, v
+    if max_points < 2:
+        raise ValueError("'max_points' must be at least 2 (minimum and maximum of a bin)!")
+
+    bin_size = int(numpy.ceil(n / (max_points // 2)))
+    n_full = (n // bin_size) * bin_size
+    bins = v[:n_full].reshape(-1, bin_size)
+    ind_min = bins.argmin(axis=1)
+    ind_max = bins.argmax(axis=1)
+    offsets = numpy.arange(bins.shape[0]) * bin_size
+    ind = numpy.stack([numpy.minimum(ind_min, ind_max), numpy.maximum(ind_min, ind_max)], axis=1)
+    ind = (ind + offsets[:, None]).ravel()
+    if n_full < n:
+        tail = v[n_full:]
+        ind = numpy.concatenate([ind, n_full + numpy.array([tail.argmin(), tail.argmax()])])
+    # drop repeated samples (bins where the minimum and maximum coincide)
+    ind = numpy.unique(ind)
+    return t[ind], v[ind]
 
 # ==============================================================================
 
@@ -10,6 +43,10 @@ import matplotlib.pyplot as plt
 class Traces:
     """
     Creates somatic membrane potential traces
+
+    Traces longer than params["max_points"] (default 5000; None to disable)
+    are decimated with :func:`decimate_minmax` before plotting, and the
+    lines are rasterized if params["rasterized"] is True (default False).
     """
 
     def __init__(self, name="traces_plot", score=None, params={}):
@@ -19,10 +56,15 @@ class Traces:
 
     def save_file(self):
         size = len(self.score.test.traces)
-        fig, axs = plt.subplots(size, figsize=(20, 7*size), squeeze=False)
+        fig = Figure(figsize=(20, 7*size))
+        FigureCanvasAgg(fig)
+        axs = fig.subplots(size, squeeze=False)
 
+        max_points = self.params["max_points"] if "max_points" in self.params else 5000
+        rasterized = self.params["rasterized"] if "rasterized" in self.params else False
         for ind, trace in enumerate(self.score.test.traces):
-            axs[ind ,0].plot(trace["t"], trace["v"], label=str(trace["stim"])+" $\mu$A/cm$^2$")
+            t, v = decimate_minmax(trace["t"], trace["v"], max_points)
+            axs[ind ,0].plot(t, v, label=str(trace["stim"])+" $\mu$A/cm$^2$", rasterized=rasterized)
             axs[ind, 0].legend(loc="best", prop={'size': 14})
             xlabel = self.params["xlabel"] if "xlabel" in self.params else None
             if xlabel:
@@ -36,5 +78,5 @@ class Traces:
 
         fig.tight_layout(h_pad=5)
         filepath = os.path.join(self.score.test.target_dir, self.filename + '.pdf')
-        plt.savefig(filepath, dpi=600, bbox_inches = "tight")
+        fig.savefig(filepath, dpi=600, bbox_inches = "tight")
         return filepath
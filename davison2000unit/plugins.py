@@ -0,0 +1,84 @@
+"""Tests, capabilities, scores, plots, models and feature extractors provided
+by other packages, as entry points
+
+A package registers its classes in the entry point group named after the
+subpackage they extend, e.g. in its setup.py:
+
+.. code-block:: python
+
+    entry_points={"davison2000unit.tests": ["MyTest = mypackage.tests:MyTest"],
+                  "davison2000unit.feature_extractors": ["fast = mypackage.features:get_feature_values"]}
+
+Once the package is installed, `davison2000unit.tests.MyTest` is available
+alongside the built-in tests, and is only imported when first accessed (see
+:func:`lazy.lazy_registry`). Feature extractors are selected by name with the
+'feature_extractor' argument of the tests (see
+:func:`simulation.extract_feature`). Built-in classes take precedence over
+plugins of the same name.
+"""
+
+import functools
+import importlib
+from davison2000unit.lazy import lazy_import
+from typing import Dict
+
+# only loaded once plugins are looked up
+metadata = lazy_import("importlib.metadata")
+
+# ===============================================================================
+
+GROUPS = ("davison2000unit.tests",
+          "davison2000unit.capabilities",
+          "davison2000unit.scores",
+          "davison2000unit.plots",
+          "davison2000unit.models",
+          "davison2000unit.feature_extractors")
+
+FEATURE_EXTRACTORS = "davison2000unit.feature_extractors"
+
+
+@functools.lru_cache(maxsize=None)
+def _all_entry_points() -> Dict[str, Dict]:
+    # the metadata of all installed distributions is read in a single pass
+    eps = metadata.entry_points()
+    if hasattr(eps, "select"):
+        eps = {group: eps.select(group=group) for group in GROUPS}
+    else:
+        # Python < 3.10
+        eps = {group: eps.get(group, ()) for group in GROUPS}
+    return {group: {ep.name: ep for ep in group_eps} for group, group_eps in eps.items()}
+
+
+def entry_points(group: str) -> Dict:
+    """Returns the plugins registered in entry point `group` (one of GROUPS),
+    as {name: entry point}, without importing any of them. The metadata is
+    read once per process, and then cached (see :func:`refresh`)."""
+    return _all_entry_points().get(group, {})
+
+
+def refresh() -> None:
+    """Discards the cached metadata, e.g. after installing a plugin in a
+    running session."""
+    _all_entry_points.cache_clear()
+
+
+def load(group: str, name: str):
+    """Imports and returns plugin `name` of entry point `group`."""
+    try:
+        entry_point = entry_points(group)[name]
+    except KeyError:
+        raise ValueError("No plugin '{}' registered in entry point group '{}'!".format(name, group))
+    return entry_point.load()
+
+
+def available(group: str) -> Dict[str, str]:
+    """Returns all classes (or feature extractors) of `group`, built-in and
+    plugins, as {name: 'module:attribute'}, without importing them."""
+    classes = {name: ep.value for name, ep in entry_points(group).items()}
+    if group == FEATURE_EXTRACTORS:
+        classes.update({"efel": "efel:getFeatureValues",
+                        "numpy": "davison2000unit.features:get_feature_values"})
+    else:
+        classes.update({name: "{}.{}:{}".format(group, module, name)
+                        for name, module in importlib.import_module(group).REGISTRY.items()})
+    return classes
@@ -0,0 +1,155 @@
+"""Optional SQLite database of the results of all validation runs"""
+
+import json
+import time
+import sqlite3
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+# ===============================================================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp REAL NOT NULL,
+    test TEXT NOT NULL,
+    test_class TEXT NOT NULL,
+    model TEXT NOT NULL,
+    model_class TEXT NOT NULL,
+    score REAL,
+    observation TEXT,
+    prediction TEXT,
+    target_dir TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_model ON runs (model);
+CREATE INDEX IF NOT EXISTS runs_test ON runs (test);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp);
+
+CREATE TABLE IF NOT EXISTS run_times (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    stim TEXT NOT NULL,
+    run_time REAL
+);
+CREATE INDEX IF NOT EXISTS run_times_run ON run_times (run_id);
+
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_run ON artifacts (run_id);
+"""
+
+
+def _to_json(data) -> str:
+    # numpy scalars and arrays are stored as plain numbers and lists
+    return json.dumps(data, default=lambda obj: obj.tolist() if hasattr(obj, "tolist") else str(obj))
+
+
+class ResultsDB:
+    """
+    Writes the results of validation runs to a local SQLite database
+
+    For each run (one test judging one model), the observation, prediction,
+    score, per-stimulus run times and the paths of all output files are
+    stored, in addition to the JSON files written by the tests. Runs are
+    indexed on model, test and timestamp.
+
+    Examples
+    --------
+    >>> test = SomaFiringFrequency(observation=obs, results_db="./results.sqlite")
+    >>> score = test.judge(model)
+    >>> with results_db.ResultsDB("./results.sqlite") as db:
+    ...     db.query(model=model.name)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def record(self, score, run_times: Optional[Dict[str, float]] = None) -> int:
+        """Stores a score bound by a test (i.e. with its 'related_data' set)
+        and returns the id of the new run.
+
+        `run_times` defaults to the test's 'run_times' attribute, if any.
+        Figures that are still being rendered in the background (see
+        :mod:`figures`) are recorded with the path they will be written to.
+        """
+        test = score.test
+        model = score.model
+        if run_times is None:
+            run_times = getattr(test, "run_times", None) or {}
+        try:
+            score_value = float(score.score)
+        except (TypeError, ValueError):
+            score_value = None
+
+        paths = []
+        for entry in score.related_data.get("figures", []):
+            if isinstance(entry, Future):
+                entry = entry.filepath
+            paths.append(entry)
+
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (timestamp, test, test_class, model, model_class, score, "
+                "observation, prediction, target_dir) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), test.name, type(test).__name__, model.name, type(model).__name__, score_value,
+                 _to_json(score.observation), _to_json(score.prediction), getattr(test, "target_dir", None)))
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO run_times (run_id, stim, run_time) VALUES (?, ?, ?)",
+                [(run_id, str(stim), float(run_time)) for stim, run_time in run_times.items()])
+            self.connection.executemany(
+                "INSERT INTO artifacts (run_id, path) VALUES (?, ?)",
+                [(run_id, path) for path in paths])
+        return run_id
+
+    def query(self, model: Optional[str] = None, test: Optional[str] = None,
+              since: Optional[float] = None, until: Optional[float] = None) -> List[Dict]:
+        """Returns the runs matching all given criteria, oldest first.
+
+        `since` and `until` are timestamps (seconds since the epoch). Each run
+        is a dict with the columns of table 'runs' (observation and prediction
+        decoded from JSON), plus 'run_times' and 'artifacts'.
+        """
+        conditions = []
+        values = []
+        for column, operator, value in (("model", "=", model), ("test", "=", test),
+                                        ("timestamp", ">=", since), ("timestamp", "<=", until)):
+            if value is not None:
+                conditions.append("{} {} ?".format(column, operator))
+                values.append(value)
+        sql = "SELECT * FROM runs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY timestamp, id"
+
+        cursor = self.connection.execute(sql, values)
+        columns = [description[0] for description in cursor.description]
+        runs = []
+        for row in cursor.fetchall():
+            run = dict(zip(columns, row))
+            run["observation"] = json.loads(run["observation"])
+            run["prediction"] = json.loads(run["prediction"])
+            run["run_times"] = dict(self.connection.execute(
+                "SELECT stim, run_time FROM run_times WHERE run_id = ?", (run["id"],)).fetchall())
+            run["artifacts"] = [path for (path,) in self.connection.execute(
+                "SELECT path FROM artifacts WHERE run_id = ?", (run["id"],)).fetchall()]
+            runs.append(run)
+        return runs
+
+
+def record_score(path: str, score, run_times: Optional[Dict[str, float]] = None) -> int:
+    """Stores `score` in the database at `path`; see :meth:`ResultsDB.record`."""
+    with ResultsDB(path) as db:
+        return db.record(score, run_times)
@@ -1,14 +1,15 @@
 """Loads all score classes"""
 
-from os.path import dirname, basename, isfile
-import glob
+from davison2000unit.lazy import lazy_registry
 
 """
-NOTE: All score files must have a prefix "score_" and extension ".py".
-Only these would be loaded.
+NOTE: All score files must have a prefix "score_" and extension ".py", and
+each of their classes must be listed below. These are only imported when
+first accessed (e.g. as `scores.RMSscore`).
 """
-files = glob.glob(dirname(__file__)+"/score_*.py")
-modules = [ basename(f)[:-3] for f in files if isfile(f)]
+REGISTRY = {
+    "RMSscore" : "score_RMS"
+}
 
-for module in modules:
-    exec("from .%s import *" % module)
+__all__ = list(REGISTRY)
+__getattr__, __dir__ = lazy_registry(__name__, REGISTRY)
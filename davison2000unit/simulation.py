@@ -0,0 +1,666 @@
+"""Helpers shared by the step current stimulus tests"""
+
+import os
+import copy
+import json
+import timeit
+import hashlib
+import weakref
+import functools
+import multiprocessing
+import numpy
+import davison2000unit.capabilities as cap
+import davison2000unit.features as features
+import davison2000unit.plugins as plugins
+from davison2000unit.lazy import lazy_import
+
+# only loaded once features are extracted
+efel = lazy_import("efel")
+
+# ===============================================================================
+
+
+class SimulationCache:
+    """
+    In-memory cache of simulated somatic Vm traces, to be shared between tests
+
+    Entries are keyed by (model, integration timestep, site, delay,
+    amplitude), and each holds the runs of that stimulus with their duration
+    and tstop, which are matched on lookup. A lookup is also satisfied by a
+    longer run of the same stimulus, provided the step current was still on
+    at the requested `tstop`; the stored trace is then truncated at `tstop`.
+    This allows the first spike latency tests (250 ms step) to reuse the runs
+    of the firing frequency tests (500 ms step) when the same cache is passed
+    to both, with the latter run first.
+
+    Traces are stored as numpy arrays, one per stimulus and tstop: storing a
+    run again replaces the earlier one. There is no eviction: the cache grows
+    with each new simulation until :meth:`clear` is called, or until the
+    model is garbage collected, which drops its entries.
+
+    Examples
+    --------
+    >>> sim_cache = simulation.SimulationCache()
+    >>> SomaFiringFrequency(observation=obs_freq, sim_cache=sim_cache).judge(model)
+    >>> SomaFirstSpikeLatency(observation=obs_lat, sim_cache=sim_cache).judge(model)
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._entries = {}
+
+    def _key(self, model, site, current):
+        if id(model) not in self._models:
+            try:
+                # entries are dropped with the model, before its id() can be reused
+                self._models[id(model)] = weakref.finalize(model, self._forget, id(model))
+            except TypeError:
+                # models that cannot be weakly referenced are held by the cache instead
+                self._models[id(model)] = model
+        return (id(model), integration_timestep(model), site, float(current["delay"]), float(current["amplitude"]))
+
+    def lookup(self, model, site: str, current: dict, tstop: float):
+        """Returns a tuple (t, v, run_time) for the requested simulation,
+        or None if no suitable run is available."""
+        stim_stop = current["delay"] + current["duration"]
+        for duration, run_tstop, t, v, run_time in self._entries.get(self._key(model, site, current), []):
+            if run_tstop < tstop:
+                continue
+            if duration == current["duration"] or min(stim_stop, current["delay"] + duration) >= tstop:
+                ind = numpy.searchsorted(t, tstop + 1e-9, side="right")
+                return t[:ind], v[:ind], run_time
+        return None
+
+    def store(self, model, site: str, current: dict, tstop: float, t, v, run_time: float) -> None:
+        """Adds the simulated trace (t, v) and its run time to the cache,
+        replacing any entry of the same stimulus duration and tstop."""
+        duration, tstop = float(current["duration"]), float(tstop)
+        key = self._key(model, site, current)
+        # the same run may be stored again, e.g. when merged from a checkpoint
+        entries = [entry for entry in self._entries.get(key, []) if entry[:2] != (duration, tstop)]
+        entries.append((duration, tstop, numpy.array(t, dtype=float), numpy.array(v, dtype=float), run_time))
+        self._entries[key] = entries
+
+    def _forget(self, model_id: int) -> None:
+        self._models.pop(model_id, None)
+        self._entries = {key: entries for key, entries in self._entries.items() if key[0] != model_id}
+
+    def clear(self) -> None:
+        for model in self._models.values():
+            if isinstance(model, weakref.finalize):
+                model.detach()
+        self._models = {}
+        self._entries = {}
+
+# ===============================================================================
+
+
+def integration_timestep(model):
+    """Returns the integration timestep (in ms) of models with the capability
+    SetIntegrationTimestep, and None for other models."""
+    if isinstance(model, cap.SetIntegrationTimestep):
+        return model.get_integration_timestep()
+    return None
+
+
+def model_id(model) -> dict:
+    """Returns the class, name, parameters and integration timestep
+    identifying `model` across processes and sessions."""
+    return {"class": type(model).__module__ + "." + type(model).__qualname__,
+            "name": model.name,
+            "params": getattr(model, "params", None),
+            "dt": integration_timestep(model)}
+
+
+class DiskCache:
+    """
+    Persistent, content-addressed cache of simulated somatic Vm traces
+
+    Each simulation is stored as an NPZ file named by the SHA-256 hash of the
+    model identity (class, name, `params` and integration timestep; see
+    :func:`model_id`), the stimulus site, the current dict and tstop. When
+    the total size of the cache exceeds `max_size_mb`, the least recently
+    used entries are evicted.
+
+    Note
+    ----
+    Model state that is not reflected in its class, name, `params` or
+    integration timestep is not part of the key; change the model name if
+    such state is modified, or clear the cache.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: float = 1024):
+        self.cache_dir = cache_dir
+        self.max_size = max_size_mb * 1024 * 1024
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+    def _path(self, model, site, current, tstop):
+        content = json.dumps({"model": model_id(model),
+                              "site": site,
+                              "current": {key: float(val) for key, val in current.items()},
+                              "tstop": float(tstop)}, sort_keys=True, default=str)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".npz")
+
+    def lookup(self, model, site: str, current: dict, tstop: float):
+        """Returns a tuple (t, v, run_time) for the requested simulation, with
+        t and v as numpy arrays, or None if it is not in the cache."""
+        path = self._path(model, site, current, tstop)
+        try:
+            with numpy.load(path) as data:
+                t, v, run_time = data["t"], data["v"], float(data["run_time"])
+            # modification time is used to track the last access
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            return None
+        return t, v, run_time
+
+    def store(self, model, site: str, current: dict, tstop: float, t, v, run_time: float) -> None:
+        """Writes the simulated trace (t, v) and its run time to the cache."""
+        path = self._path(model, site, current, tstop)
+        # write to a temporary file first, so that concurrent readers (e.g.
+        # other worker processes) never see a partially written entry
+        tmp_path = "{}.{}.tmp.npz".format(path[:-4], os.getpid())
+        numpy.savez(tmp_path, t=numpy.asarray(t, dtype=float), v=numpy.asarray(v, dtype=float),
+                    run_time=run_time)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used entries until the cache fits in its size limit."""
+        entries = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(".npz") or ".tmp." in filename:
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, filename))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, filename))
+        total_size = sum(entry[1] for entry in entries)
+        for _, size, filename in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError:
+                pass
+            total_size -= size
+
+# ===============================================================================
+
+
+def lookup_simulation(test, model, site: str, current: dict, tstop: float):
+    """Looks up a simulation in `test.sim_cache` and then `test.disk_cache`.
+    Returns a tuple (t, v, run_time), or None if neither holds it."""
+    cache = getattr(test, "sim_cache", None)
+    disk_cache = getattr(test, "disk_cache", None)
+    cached = cache.lookup(model, site, current, tstop) if cache is not None else None
+    if cached is None and disk_cache is not None:
+        cached = disk_cache.lookup(model, site, current, tstop)
+        if cached is not None and cache is not None:
+            cache.store(model, site, current, tstop, *cached)
+    return cached
+
+
+def store_simulation(test, model, site: str, current: dict, tstop: float, t, v, run_time: float) -> None:
+    """Adds a simulation to `test.sim_cache` and `test.disk_cache`, if present."""
+    for cache in (getattr(test, "sim_cache", None), getattr(test, "disk_cache", None)):
+        if cache is not None:
+            cache.store(model, site, current, tstop, t, v, run_time)
+
+
+def record_run_time(test, stim: float, run_time) -> None:
+    """Records the `run_time` of stimulus `stim` in `test.run_times`. A
+    run_time of None marks a stimulus served from a cache, which is added to
+    `test.cached_stims` instead, so that only actual simulations are timed."""
+    if run_time is None:
+        if getattr(test, "cached_stims", None) is None:
+            test.cached_stims = []
+        if stim not in test.cached_stims:
+            test.cached_stims.append(stim)
+    else:
+        test.run_times[str(stim)] = run_time
+
+
+def _pop_run_time(test, stim: float):
+    # undoes record_run_time, returning the run time (None if served from a cache)
+    if stim in (getattr(test, "cached_stims", None) or []):
+        test.cached_stims.remove(stim)
+    return test.run_times.pop(str(stim), None)
+
+# ===============================================================================
+
+
+def rest_state(test, model, site: str, stim_start: float):
+    """Returns the state reached at time `stim_start` (in ms) by a model with
+    the capability SaveRestoreState, with no current injected at `site`, as
+    a tuple (snapshot, t, v) with the somatic Vm trace up to `stim_start`.
+
+    The rest period is simulated once per model, `stim_start` and integration
+    timestep, and then kept in `test.rest_states`, so that the simulations
+    of all stimulus amplitudes can start from the snapshot.
+    """
+    if getattr(test, "rest_states", None) is None:
+        test.rest_states = {}
+    key = (json.dumps(model_id(model), sort_keys=True, default=str), float(stim_start))
+    if key not in test.rest_states:
+        rest_current = {'delay': 0.0, 'duration': 0.0, 'amplitude': 0.0}
+        if site == "soma":
+            model.inject_step_current_soma(current=rest_current)
+        else:
+            model.inject_step_current_glomerulus(current=rest_current)
+        t, v = model.get_membrane_potential_soma(tstop=stim_start)
+        test.rest_states[key] = (model.save_state(), numpy.asarray(t, dtype=float), numpy.asarray(v, dtype=float))
+    return test.rest_states[key]
+
+
+def _prepend_rest(rest, t, v):
+    # the rest period, followed by the samples simulated after the snapshot
+    _, rest_t, rest_v = rest
+    t = numpy.asarray(t, dtype=float)
+    after = t > rest_t[-1]
+    return numpy.concatenate((rest_t, t[after])), numpy.concatenate((rest_v, numpy.asarray(v, dtype=float)[after]))
+
+
+def simulate_step_current(test, model, site: str, current: dict, tstop: float,
+                          spikes_only: bool = False, until_first_spike: bool = False):
+    """Injects the step `current` at `site` ('soma' or 'glomerulus') and
+    returns the resulting somatic Vm trace in eFEL format.
+
+    The simulation is skipped if `test.sim_cache` or `test.disk_cache`
+    holds a matching run; the amplitude is then added to `test.cached_stims`.
+    Otherwise, the run time is recorded in `test.run_times`, keyed by
+    amplitude (see :func:`record_run_time`).
+
+    If `spikes_only` is True and the model has the capability
+    RecordSpikeTimesSoma, only spike times are recorded; the returned dict
+    then has the key 'spike_times' instead of 'T' and 'V'. Such runs are
+    not added to the caches.
+
+    If `until_first_spike` is True and the model has the capability
+    RecordMembranePotentialSomaUntilSpike, the simulation is halted after the
+    first spike following the stimulus onset (taking precedence over
+    `spikes_only`). Such truncated runs are not added to the caches either.
+
+    Models with the capability SaveRestoreState start from the state reached
+    at the stimulus onset (see :func:`rest_state`), so that only the period
+    after it is simulated, and timed, for each amplitude. The returned trace
+    still covers the whole simulation.
+    """
+    stim_start = current["delay"]
+    stim_stop = current["delay"] + current["duration"]
+    cached = lookup_simulation(test, model, site, current, tstop)
+    if cached:
+        t, v, _ = cached
+        # no simulation was run
+        run_time = None
+        trace = {'T' : t,
+                 'V' : v,
+                 'stim_start' : [stim_start],
+                 'stim_end'   : [stim_stop]}
+    else:
+        if site not in ("soma", "glomerulus"):
+            raise ValueError("Unknown stimulus site '{}'!".format(site))
+        rest = None
+        if isinstance(model, cap.SaveRestoreState) and stim_start > 0:
+            rest = rest_state(test, model, site, stim_start)
+        if site == "soma":
+            model.inject_step_current_soma(current=current)
+        else:
+            model.inject_step_current_glomerulus(current=current)
+        if rest is not None:
+            model.restore_state(rest[0])
+        # only complete Vm traces are cached
+        cacheable = False
+        if until_first_spike and isinstance(model, cap.RecordMembranePotentialSomaUntilSpike):
+            start = timeit.default_timer()
+            t, v = model.get_membrane_potential_soma_until_spike(tstop=tstop, start=stim_start)
+            stop = timeit.default_timer()
+            run_time = stop - start
+            trace = {'T' : t,
+                     'V' : v,
+                     'stim_start' : [stim_start],
+                     'stim_end'   : [stim_stop]}
+        elif spikes_only and isinstance(model, cap.RecordSpikeTimesSoma):
+            start = timeit.default_timer()
+            spike_times = model.get_spike_times_soma(tstop=tstop)
+            stop = timeit.default_timer()
+            run_time = stop - start
+            trace = {'spike_times' : list(spike_times),
+                     'stim_start' : [stim_start],
+                     'stim_end'   : [stim_stop]}
+        else:
+            start = timeit.default_timer()
+            trace = model.get_membrane_potential_soma_eFEL_format(tstop=tstop,
+                                                                  start=stim_start,
+                                                                  stop=stim_stop)
+            stop = timeit.default_timer()
+            run_time = stop - start
+            cacheable = True
+        if rest is not None:
+            if 'spike_times' in trace:
+                trace['spike_times'] = features.spike_times(rest[1], rest[2]).tolist() + trace['spike_times']
+            else:
+                trace['T'], trace['V'] = _prepend_rest(rest, trace['T'], trace['V'])
+        if cacheable:
+            store_simulation(test, model, site, current, tstop, trace["T"], trace["V"], run_time)
+    record_run_time(test, current["amplitude"], run_time)
+    return trace
+
+# ===============================================================================
+
+
+def _run_stim_isolated(test, model, stim):
+    """Runs a single stimulus inside a worker process.
+
+    The worker receives its own unpickled copy of `test` and `model`, so that
+    no simulator state is shared between stimuli. Returns a tuple of (eFEL
+    trace, run time, trace) to be merged by the parent; the run time is None
+    if the stimulus was served from the disk cache.
+    """
+    test.traces = []
+    test.run_times = {}
+    test.cached_stims = []
+    efel_trace = test.run_stim(model, stim)
+    return efel_trace, test.run_times.get(str(stim)), test.traces[0] if test.traces else None
+
+
+def use_batch(test, model, stim_list) -> bool:
+    """Returns True if the stimuli in `stim_list` are to be simulated in a
+    single run of a model with the capability RecordMembranePotentialSomaBatch
+    (see :func:`run_stim_batch`).
+
+    Batches always record the full Vm traces, so they are not used when the
+    test asks for a cheaper recording supported by the model: halting at the
+    first spike ('early_stop', capability RecordMembranePotentialSomaUntilSpike)
+    or spike times only ('plot_traces' False, capability RecordSpikeTimesSoma).
+    """
+    if not isinstance(model, cap.RecordMembranePotentialSomaBatch) or len(stim_list) <= 1:
+        return False
+    if getattr(test, "early_stop", False) and isinstance(model, cap.RecordMembranePotentialSomaUntilSpike):
+        return False
+    if not getattr(test, "plot_traces", True) and isinstance(model, cap.RecordSpikeTimesSoma):
+        return False
+    return True
+
+
+def run_stim_batch(test, model, stim_list):
+    """Simulates all stimuli in `stim_list` in a single run of a model with
+    the capability RecordMembranePotentialSomaBatch.
+
+    Stimuli held by `test.sim_cache` or `test.disk_cache` are not simulated
+    again (and are added to `test.cached_stims`), and the others are added to
+    the caches. The run time of the batch is shared equally among its
+    simulated stimuli in `test.run_times`. As in
+    :func:`simulate_step_current`, models with the capability
+    SaveRestoreState start all copies from the state at the stimulus onset.
+
+     Returns
+     -------
+     list
+         eFEL traces, in the same order as `stim_list`
+     """
+    protocols = {stim: test.stim_protocol(stim) for stim in stim_list}
+    outputs = {}
+    batches = {}
+    for stim in stim_list:
+        site, current, tstop = protocols[stim]
+        cached = lookup_simulation(test, model, site, current, tstop)
+        if cached is not None:
+            outputs[stim] = (cached[0], cached[1], None)
+        elif stim not in batches.get((site, current["delay"], tstop), []):
+            batches.setdefault((site, current["delay"], tstop), []).append(stim)
+
+    # the stimuli of a test normally share the same site, onset and duration
+    for (site, stim_start, tstop), stims in batches.items():
+        rest = None
+        if isinstance(model, cap.SaveRestoreState) and stim_start > 0:
+            rest = rest_state(test, model, site, stim_start)
+        currents = [protocols[stim][1] for stim in stims]
+        model.inject_step_current_batch(site=site, currents=currents)
+        if rest is not None:
+            model.restore_state(rest[0])
+        start = timeit.default_timer()
+        traces = model.get_membrane_potential_soma_batch(tstop=tstop)
+        stop = timeit.default_timer()
+        run_time = (stop - start) / len(stims)
+        if rest is not None:
+            traces = [_prepend_rest(rest, t, v) for t, v in traces]
+        for stim, current, (t, v) in zip(stims, currents, traces):
+            outputs[stim] = (t, v, run_time)
+            store_simulation(test, model, site, current, tstop, t, v, run_time)
+
+    efel_traces = []
+    for stim in stim_list:
+        site, current, tstop = protocols[stim]
+        t, v, run_time = outputs[stim]
+        record_run_time(test, stim, run_time)
+        if getattr(test, "plot_traces", True):
+            test.traces.append({"stim" : stim,
+                                "t" : t,
+                                "v" : v})
+        efel_traces.append({'T' : t,
+                            'V' : v,
+                            'stim_start' : [current["delay"]],
+                            'stim_end'   : [current["delay"] + current["duration"]]})
+    return efel_traces
+
+
+def run_stim_list(test, model, stim_list, n_workers=1):
+    """Evaluates `test.run_stim` for each stimulus amplitude in `stim_list`.
+
+     Parameters
+     ----------
+     test : sciunit.Test
+         test instance providing `run_stim`, `traces` and `run_times`
+     model : sciunit.Model
+         model being tested
+     stim_list : list
+         stimulus amplitudes (in nA)
+     n_workers : int
+         number of worker processes; 1 (default) runs all stimuli serially
+
+     Note
+     ----
+     With `n_workers` > 1, each stimulus is simulated in a freshly spawned
+     process holding its own copy of the model. The
+     model must therefore be picklable, and scripts using this mode must be
+     protected by an ``if __name__ == "__main__":`` guard. The 'spawn' start
+     method is used as forking a process that has already imported
+     matplotlib/X libraries is what gave the earlier [xcb] errors.
+     Stimuli already available in `test.sim_cache` or `test.disk_cache` are
+     not dispatched to the workers, and the traces simulated by the workers
+     are added to the in-memory cache.
+     Models with the capability RecordMembranePotentialSomaBatch instead
+     simulate all stimuli in a single run (see :func:`run_stim_batch`),
+     whatever the value of `n_workers`, unless :func:`use_batch` gives
+     precedence to early stopping or spike time recording.
+     If `test.checkpoint` is set (see :class:`checkpoint.Checkpoint`), the
+     stimuli it holds are not simulated again, and each other stimulus is
+     added to it once completed.
+
+     Returns
+     -------
+     list
+         eFEL traces returned by `test.run_stim`, in the same order as `stim_list`
+     """
+    # stimuli already simulated elsewhere (see davison2000unit.suite)
+    outputs = dict(getattr(test, "precomputed", None) or {})
+    checkpoint = getattr(test, "checkpoint", None)
+    if checkpoint is not None:
+        # resume from the stimuli recorded by an earlier, interrupted run,
+        # and record each remaining stimulus as soon as it is completed
+        protocols = {stim: test.stim_protocol(stim) for stim in stim_list}
+        held = checkpoint.load(protocols)
+        # stimuli simulated elsewhere are recorded as well
+        for stim, output in outputs.items():
+            if stim in protocols and stim not in held:
+                checkpoint.append(stim, protocols[stim], output)
+        outputs = {**held, **outputs}
+        remaining = [stim for stim in protocols if stim not in outputs]
+        for stim, output in _run_stims(test, model, remaining, n_workers):
+            checkpoint.append(stim, protocols[stim], output)
+            outputs[stim] = output
+    if outputs:
+        return merge_outputs(test, model, stim_list, outputs)
+    if use_batch(test, model, stim_list):
+        return run_stim_batch(test, model, stim_list)
+    if n_workers <= 1 or len(stim_list) <= 1:
+        return [test.run_stim(model, stim) for stim in stim_list]
+
+    pending = [stim for stim in stim_list
+               if lookup_simulation(test, model, *test.stim_protocol(stim)) is None]
+    outputs = {}
+    if pending:
+        worker_test = worker_copy(test)
+        ctx = multiprocessing.get_context("spawn")
+        run_stim_ = functools.partial(_run_stim_isolated, worker_test, model)
+        with ctx.Pool(min(n_workers, len(pending)), maxtasksperchild=1) as pool:
+            outputs = dict(zip(pending, pool.map(run_stim_, pending, chunksize=1)))
+    return merge_outputs(test, model, stim_list, outputs)
+
+
+def _run_stim_keyed(test, model, stim):
+    return stim, _run_stim_isolated(test, model, stim)
+
+
+def _run_stims(test, model, stim_list, n_workers=1):
+    """Runs the stimuli in `stim_list` as :func:`run_stim_list` does, but
+    yields a tuple of (stim, output of :func:`_run_stim_isolated`) as soon
+    as each stimulus is completed, leaving `test.traces`, `test.run_times`
+    and `test.cached_stims` unchanged (see :func:`merge_outputs`)."""
+    if use_batch(test, model, stim_list):
+        n_traces = len(test.traces)
+        efel_traces = run_stim_batch(test, model, stim_list)
+        traces = test.traces[n_traces:]
+        del test.traces[n_traces:]
+        for ind, (stim, efel_trace) in enumerate(zip(stim_list, efel_traces)):
+            yield stim, (efel_trace, _pop_run_time(test, stim), traces[ind] if traces else None)
+        return
+
+    # stimuli to be simulated in worker processes; cached ones are read here
+    pending = []
+    if n_workers > 1 and len(stim_list) > 1:
+        pending = [stim for stim in stim_list
+                   if lookup_simulation(test, model, *test.stim_protocol(stim)) is None]
+    for stim in stim_list:
+        if stim not in pending:
+            n_traces = len(test.traces)
+            efel_trace = test.run_stim(model, stim)
+            trace = test.traces.pop() if len(test.traces) > n_traces else None
+            yield stim, (efel_trace, _pop_run_time(test, stim), trace)
+    if pending:
+        ctx = multiprocessing.get_context("spawn")
+        run_stim_ = functools.partial(_run_stim_keyed, worker_copy(test), model)
+        with ctx.Pool(min(n_workers, len(pending)), maxtasksperchild=1) as pool:
+            for stim, output in pool.imap_unordered(run_stim_, pending):
+                yield stim, output
+
+
+def worker_copy(test):
+    """Returns a shallow copy of `test` to be sent to worker processes.
+    The in-memory cache stays in the parent process; the disk cache, if any,
+    is written by the workers. As pool workers are daemonic processes, which
+    cannot start processes of their own, the copy runs its stimuli serially
+    (`n_workers` = 1) and renders its figures immediately (`defer_figures`
+    = False)."""
+    worker_test = copy.copy(test)
+    worker_test.n_workers = 1
+    worker_test.defer_figures = False
+    worker_test.sim_cache = None
+    worker_test.efel_map = None
+    worker_test.precomputed = None
+    worker_test.checkpoint = None
+    worker_test.rest_states = None
+    return worker_test
+
+
+def merge_outputs(test, model, stim_list, outputs):
+    """Returns the eFEL traces for `stim_list`, taking the runs in `outputs`
+    ({stim: output of :func:`_run_stim_isolated`}) from worker processes,
+    and running `test.run_stim` for the others (e.g. served from the cache).
+    The runs in `outputs` are added to `test.run_times` (or
+    `test.cached_stims`), `test.traces` and the in-memory cache, as if they
+    had been run by `test.run_stim`."""
+    cache = getattr(test, "sim_cache", None)
+
+    # runs halted at the first spike (see simulate_step_current) are not cached
+    stopped_early = (getattr(test, "early_stop", False)
+                     and isinstance(model, cap.RecordMembranePotentialSomaUntilSpike))
+    efel_traces = []
+    for stim in stim_list:
+        if stim in outputs:
+            efel_trace, run_time, trace = outputs[stim]
+            record_run_time(test, stim, run_time)
+            if trace is not None:
+                test.traces.append(trace)
+            if cache is not None and "T" in efel_trace and not stopped_early:
+                cache.store(model, *test.stim_protocol(stim), efel_trace["T"], efel_trace["V"], run_time)
+        else:
+            # served from the cache
+            efel_trace = test.run_stim(model, stim)
+        efel_traces.append(efel_trace)
+    return efel_traces
+
+# ===============================================================================
+
+
+def extract_feature(efel_traces, feature: str, parallel_map=None, extractor: str = "efel"):
+    """Extracts an eFEL feature from all `efel_traces` in a single call.
+
+     Parameters
+     ----------
+     efel_traces : list
+         traces in eFEL format
+     feature : string
+         name of the eFEL feature
+     parallel_map : callable
+         optional map function passed on to eFEL to process the traces in
+         parallel, e.g. `multiprocessing.Pool().map`
+     extractor : string
+         'efel' (default) or 'numpy'; the latter uses the spike detector in
+         :mod:`davison2000unit.features` instead of eFEL. Any other name
+         selects a plugin of the entry point group
+         'davison2000unit.feature_extractors' (see :mod:`davison2000unit.plugins`),
+         called as :func:`features.get_feature_values`
+
+     Returns
+     -------
+     list
+         first value of the feature for each trace; None if not computable
+
+     Note
+     ----
+     Traces holding only 'spike_times' (see :func:`simulate_step_current`)
+     are always processed by :mod:`davison2000unit.features`.
+     """
+    if extractor == "numpy" or any("T" not in trace for trace in efel_traces):
+        return features.get_feature_values(efel_traces, feature)
+    elif extractor != "efel":
+        try:
+            get_feature_values = plugins.load(plugins.FEATURE_EXTRACTORS, extractor)
+        except ValueError:
+            raise ValueError("Unknown feature extractor '{}'!".format(extractor))
+        return list(get_feature_values(efel_traces, feature))
+
+    try:
+        feature_values = efel.getFeatureValues(efel_traces, [feature], parallel_map=parallel_map)
+    except Exception:
+        # fall back to one call per trace so that a single failing trace
+        # does not invalidate the others
+        feature_values = []
+        for efel_trace in efel_traces:
+            try:
+                feature_values.extend(efel.getFeatureValues([efel_trace], [feature]))
+            except Exception:
+                feature_values.append({feature: None})
+
+    values = []
+    for feature_value in feature_values:
+        try:
+            values.append(feature_value[feature][0])
+        except (TypeError, IndexError, KeyError):
+            values.append(None)
+    return values
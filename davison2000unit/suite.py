@@ -0,0 +1,190 @@
+"""Runs several tests against several models on a pool of worker processes"""
+
+import os
+import json
+import functools
+import multiprocessing
+import davison2000unit.simulation as simulation
+from davison2000unit.tests.test_RunTime import RunTime
+from typing import Dict, List, Optional, Tuple
+
+# ===============================================================================
+
+
+def load_run_times(base_dir: str) -> Dict[Tuple[str, str], Dict[str, float]]:
+    """Returns the per-stimulus run times saved by earlier runs of the tests,
+    as {(test name, model name): {stim: run time (s)}}.
+
+     Parameters
+     ----------
+     base_dir : string
+         path to directory named 'validation_davison2000unit'
+     """
+    run_times = {}
+    if not os.path.isdir(base_dir):
+        return run_times
+    with os.scandir(base_dir) as test_entries:
+        test_dirs = [(entry.name, entry.path) for entry in test_entries if entry.is_dir()]
+    for test_name, test_dir in test_dirs:
+        with os.scandir(test_dir) as model_entries:
+            model_dirs = [(entry.name, entry.path) for entry in model_entries if entry.is_dir()]
+        for model_name, model_dir in model_dirs:
+            with os.scandir(model_dir) as file_entries:
+                filenames = [entry.name for entry in file_entries if entry.name.endswith(".json")]
+            for filename in filenames:
+                try:
+                    with open(os.path.join(model_dir, filename)) as f:
+                        data = json.load(f)
+                except ValueError:
+                    continue
+                if isinstance(data, dict) and isinstance(data.get("run_times"), dict):
+                    run_times[(test_name, model_name)] = data["run_times"]
+    return run_times
+
+
+def _expected_run_time(test, model, stim, run_times) -> float:
+    # earlier run time if known; otherwise the simulated duration (in s), as
+    # a rough guess that is at least proportional to the actual run time
+    history = run_times.get((test.name, model.name), {})
+    if str(stim) in history:
+        return history[str(stim)]
+    _, _, tstop = test.stim_protocol(stim)
+    return tstop * 1e-3
+
+
+def _judge_isolated(test, model):
+    """Judges `model` with `test` inside a worker process."""
+    return test.judge(model)
+
+
+def run_suite(tests: List, models: List, n_workers: Optional[int] = None, isolated: bool = True,
+              run_times: Optional[Dict[Tuple[str, str], Dict[str, float]]] = None) -> Dict[Tuple[str, str], object]:
+    """Judges each of the `models` with each of the `tests`.
+
+    Rather than running each `judge` call in turn, the simulations of all
+    (test, model, stimulus) combinations are run as independent jobs on a
+    pool of `n_workers` processes, longest job first, using the run times
+    saved by earlier runs (see :func:`load_run_times`) as expected durations.
+    Each test then computes and saves its results from these simulations in
+    the main process, as soon as all of its simulations have completed.
+
+    Tests that do not simulate a fixed list of stimuli (e.g. with
+    'adaptive_sweep'), and models that simulate all stimuli in a single run
+    (see :func:`simulation.use_batch`), are run as a whole in a
+    single job. Tests 'RunTime' are run last, one at a time, once all other
+    jobs have completed, so that their timing is not disturbed by other
+    simulations.
+
+    For tests with 'resume', the stimuli held by their checkpoint are not
+    simulated again, and each stimulus simulated by a worker is added to the
+    checkpoint as soon as it has completed (see davison2000unit.checkpoint).
+
+    Tests judged as a whole inside a worker process run their stimuli
+    serially and render their figures immediately, whatever their
+    `n_workers` and `defer_figures` (see :func:`simulation.worker_copy`), as
+    pool workers cannot start processes of their own. With 'adaptive_sweep',
+    the sweep then uses bisection rather than k-section.
+
+     Parameters
+     ----------
+     tests : list
+         test instances, e.g. [SomaFiringFrequency(observation=obs), RunTime(observation=0.0)]
+     models : list
+         model instances; these must be picklable
+     n_workers : int
+         number of worker processes; default is the number of CPUs minus one
+     isolated : bool
+         if True (default), each job runs in a freshly spawned process, so that
+         no simulator state is shared between jobs; set to False to reuse the
+         worker processes, e.g. for models without global simulator state
+     run_times : dict
+         expected run times, as returned by :func:`load_run_times`; default
+         is loaded from the output directory of each test
+
+     Note
+     ----
+     As with `n_workers` > 1 in the tests, scripts using this function must
+     be protected by an ``if __name__ == "__main__":`` guard.
+
+     Returns
+     -------
+     dict
+         The scores, as {(test name, model name): score}
+
+     Examples
+     --------
+     >>> scores = suite.run_suite([tests.SomaFiringFrequency(observation=obs), tests.RunTime(observation=0.0)],
+     ...                          [model_2C, model_3C, model_4C, model_Full])
+     """
+    if n_workers is None:
+        n_workers = max(1, (os.cpu_count() or 2) - 1)
+    if run_times is None:
+        run_times = {}
+        for output_dir in set(os.path.abspath(test.output_dir) for test in tests):
+            run_times.update(load_run_times(os.path.join(output_dir, "validation_davison2000unit")))
+
+    # job graph: one job per stimulus, or per test for tests run as a whole
+    stim_jobs = []      # (expected run time, test index, model index, stim)
+    whole_jobs = []     # (test index, model index)
+    run_time_jobs = []
+    checkpoints = {}    # (test index, model index): checkpoint of tests with 'resume'
+    for test_ind, test in enumerate(tests):
+        for model_ind, model in enumerate(models):
+            if isinstance(test, RunTime):
+                run_time_jobs.append((test_ind, model_ind))
+            elif (not hasattr(test, "stim_protocol") or getattr(test, "adaptive_sweep", False)
+                  or simulation.use_batch(test, model, list(test.observation.keys()))):
+                whole_jobs.append((test_ind, model_ind))
+            else:
+                stims = sorted(set(map(float, test.observation.keys())))
+                held = {}
+                checkpoint = test.open_checkpoint(model) if hasattr(test, "open_checkpoint") else None
+                if checkpoint is not None:
+                    checkpoints[(test_ind, model_ind)] = checkpoint
+                    held = checkpoint.load({stim: test.stim_protocol(stim) for stim in stims})
+                for stim in stims:
+                    if stim not in held and simulation.lookup_simulation(test, model, *test.stim_protocol(stim)) is None:
+                        stim_jobs.append((_expected_run_time(test, model, stim, run_times), test_ind, model_ind, stim))
+    stim_jobs.sort(key=lambda job: job[0], reverse=True)
+
+    scores = {}
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(n_workers, maxtasksperchild=1 if isolated else None) as pool:
+        worker_tests = [simulation.worker_copy(test) for test in tests]
+        results = {}
+        for test_ind, model_ind in whole_jobs:
+            results[(test_ind, model_ind)] = pool.apply_async(_judge_isolated, (worker_tests[test_ind], models[model_ind]))
+        stim_results = {}
+        for _, test_ind, model_ind, stim in stim_jobs:
+            # each completed stimulus is checkpointed at once, so that an
+            # interrupted suite resumes from it
+            checkpoint = checkpoints.get((test_ind, model_ind))
+            callback = None
+            if checkpoint is not None:
+                callback = functools.partial(checkpoint.append, stim, tests[test_ind].stim_protocol(stim))
+            stim_results.setdefault((test_ind, model_ind), {})[stim] = pool.apply_async(
+                simulation._run_stim_isolated, (worker_tests[test_ind], models[model_ind], stim), callback=callback)
+
+        # test/model pairs in the order in which their last job was submitted
+        pairs = [(test_ind, model_ind) for test_ind, test in enumerate(tests) for model_ind in range(len(models))
+                 if (test_ind, model_ind) not in results and not isinstance(test, RunTime)]
+        last_job = {(test_ind, model_ind): ind for ind, (_, test_ind, model_ind, _) in enumerate(stim_jobs)}
+        pairs.sort(key=lambda pair: last_job.get(pair, -1))
+        for test_ind, model_ind in pairs:
+            test = tests[test_ind]
+            model = models[model_ind]
+            test.precomputed = {stim: result.get()
+                                for stim, result in stim_results.get((test_ind, model_ind), {}).items()}
+            try:
+                scores[(test.name, model.name)] = test.judge(model)
+            finally:
+                test.precomputed = None
+        for (test_ind, model_ind), result in results.items():
+            scores[(tests[test_ind].name, models[model_ind].name)] = result.get()
+
+    # 'RunTime' on an otherwise idle machine, each in its own process
+    for test_ind, model_ind in run_time_jobs:
+        with ctx.Pool(1, maxtasksperchild=1) as pool:
+            score = pool.apply(_judge_isolated, (worker_tests[test_ind], models[model_ind]))
+        scores[(tests[test_ind].name, models[model_ind].name)] = score
+    return scores
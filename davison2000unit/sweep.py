@@ -0,0 +1,124 @@
+"""Adaptive sweep of the stimulus amplitude, to find the rheobase and a dense
+firing frequency / latency vs current curve from few simulations"""
+
+import numpy
+import davison2000unit.simulation as simulation
+from typing import Dict, List, Optional, Tuple
+
+# ===============================================================================
+
+
+def _fires(value) -> bool:
+    # no spike gives a firing frequency of zero, or a latency of NaN
+    return value is not None and bool(numpy.isfinite(value)) and value > 0
+
+
+def adaptive_sweep(test, model, stim_range: Tuple[float, float], max_sims: int = 20,
+                   rheobase_tol: Optional[float] = None, n_initial: int = 5) -> Dict:
+    """Samples `test.extract_features` over the amplitudes in `stim_range`.
+
+    | 1. a coarse grid of `n_initial` amplitudes spanning `stim_range`
+    | 2. bisection between the largest silent and smallest firing amplitudes,
+    |    until they are less than `rheobase_tol` nA apart
+    | 3. refinement, by splitting the intervals above rheobase over which the
+    |    feature changes the most, until `max_sims` simulations have been run
+
+    With `test.n_workers` > 1, each step evaluates `test.n_workers`
+    amplitudes at a time (in isolated processes; see
+    :func:`simulation.run_stim_list`), so bisection becomes k-section.
+
+     Parameters
+     ----------
+     test : sciunit.Test
+         test instance providing `run_stim`, `extract_features` and `n_workers`
+     model : sciunit.Model
+         model being tested
+     stim_range : tuple
+         lowest and highest stimulus amplitudes (in nA)
+     max_sims : int
+         maximum number of simulations
+     rheobase_tol : float
+         accuracy of the rheobase (in nA); default is 1% of `stim_range`
+     n_initial : int
+         number of amplitudes of the initial grid
+
+     Returns
+     -------
+     dict
+         'rheobase' (smallest amplitude found to elicit a spike, or None),
+         'rheobase_bracket', 'n_simulations', and the sampled curve as
+         'stims' and 'values' in increasing order of amplitude
+     """
+    lo, hi = map(float, stim_range)
+    if rheobase_tol is None:
+        rheobase_tol = 0.01 * (hi - lo)
+    n_batch = max(1, getattr(test, "n_workers", 1))
+    samples = {}
+
+    def evaluate(stim_list):
+        stim_list = [stim for stim in stim_list if stim not in samples][:max_sims - len(samples)]
+        if stim_list:
+            efel_traces = simulation.run_stim_list(test, model, stim_list, test.n_workers)
+            samples.update(zip(stim_list, test.extract_features(efel_traces)))
+        return stim_list
+
+    # 1. coarse grid
+    evaluate([float(stim) for stim in numpy.linspace(lo, hi, max(2, n_initial))])
+
+    # 2. rheobase
+    firing = sorted(stim for stim, value in samples.items() if _fires(value))
+    rheobase = None
+    lower = None
+    if firing:
+        rheobase = firing[0]
+        silent = [stim for stim in samples if stim < rheobase]
+        lower = max(silent) if silent else None
+        while lower is not None and rheobase - lower > rheobase_tol:
+            new_stims = evaluate([float(stim) for stim in numpy.linspace(lower, rheobase, n_batch + 2)[1:-1]])
+            if not new_stims:
+                break
+            rheobase = min([stim for stim in new_stims if _fires(samples[stim])], default=rheobase)
+            lower = max([stim for stim in new_stims if not _fires(samples[stim]) and stim < rheobase], default=lower)
+
+    # 3. refinement where the feature changes fastest
+    while rheobase is not None and len(samples) < max_sims:
+        stims = sorted(stim for stim in samples if stim >= rheobase)
+        changes = []
+        for stim1, stim2 in zip(stims[:-1], stims[1:]):
+            if stim2 - stim1 <= rheobase_tol:
+                continue
+            change = abs(samples[stim2] - samples[stim1])
+            changes.append((change if numpy.isfinite(change) else numpy.inf, stim1, stim2))
+        changes.sort(reverse=True)
+        if not evaluate([(stim1 + stim2) / 2.0 for _, stim1, stim2 in changes[:n_batch]]):
+            break
+
+    stims = sorted(samples)
+    return {"stim_range": [lo, hi],
+            "rheobase": rheobase,
+            "rheobase_bracket": [lower, rheobase],
+            "n_simulations": len(samples),
+            "stims": stims,
+            "values": [samples[stim] for stim in stims]}
+
+
+def interpolate(sweep: Dict, stim_list: List[float]) -> List[float]:
+    """Returns the values of the curve from :func:`adaptive_sweep` at the
+    amplitudes in `stim_list`, by linear interpolation above rheobase."""
+    samples = dict(zip(sweep["stims"], sweep["values"]))
+    rheobase = sweep["rheobase"]
+    if rheobase is not None:
+        firing = [(stim, value) for stim, value in samples.items() if stim >= rheobase and numpy.isfinite(value)]
+        firing_stims, firing_values = zip(*sorted(firing))
+
+    results = []
+    for stim in stim_list:
+        if stim in samples:
+            results.append(samples[stim])
+        elif rheobase is None or stim < rheobase:
+            # below rheobase, as the closest silent amplitude sampled
+            silent = [s for s in samples if s <= stim] or [min(samples)]
+            results.append(samples[max(silent)])
+        else:
+            results.append(float(numpy.interp(stim, firing_stims, firing_values)))
+    return results
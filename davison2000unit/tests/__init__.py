@@ -1,14 +1,20 @@
 """Loads all test classes"""
 
-from os.path import dirname, basename, isfile
-import glob
+from davison2000unit.lazy import lazy_registry
 
 """
-NOTE: All test files must have a prefix "test_" and extension ".py".
-Only these would be loaded.
+NOTE: All test files must have a prefix "test_" and extension ".py", and
+each of their classes must be listed below. These are only imported when
+first accessed (e.g. as `tests.GlomFiringFrequency`).
 """
-files = glob.glob(dirname(__file__)+"/test_*.py")
-modules = [ basename(f)[:-3] for f in files if isfile(f)]
+REGISTRY = {
+    "GlomFiringFrequency"   : "test_GlomFiringFrequency",
+    "GlomFirstSpikeLatency" : "test_GlomFirstSpikeLatency",
+    "RunTime"               : "test_RunTime",
+    "SomaFiringFrequency"   : "test_SomaFiringFrequency",
+    "SomaFirstSpikeLatency" : "test_SomaFirstSpikeLatency",
+    "TimestepConvergence"   : "test_TimestepConvergence"
+}
 
-for module in modules:
-    exec("from .%s import *" % module)
+__all__ = list(REGISTRY)
+__getattr__, __dir__ = lazy_registry(__name__, REGISTRY)
@@ -1,14 +1,17 @@
 import os
 import json
+import time
 import numpy
 import timeit
 import sciunit
 import davison2000unit.capabilities as cap
+import davison2000unit.figures as figures
+import davison2000unit.features as features
 import davison2000unit.plots as plots
+import davison2000unit.results_db as resultsdb
+import davison2000unit.trace_io as trace_io
 from sciunit.scores import FloatScore
-from typing import Dict, Optional
-
-import functools
+from typing import Dict, List, Optional, Tuple
 
 # ===============================================================================
 
@@ -26,11 +29,34 @@ class RunTime(sciunit.Test):
     def __init__(self,
                  observation: Dict[str, float] = {},
                  name: str = "Run Time",
-                 output_dir: str = ".") -> None:
+                 output_dir: str = ".",
+                 record_trace: bool = True,
+                 chunk_size: int = 100000,
+                 n_warmup: int = 0,
+                 n_repeats: int = 1,
+                 scaling_durations: Optional[List[float]] = None,
+                 defer_figures: bool = False,
+                 results_db: Optional[str] = None) -> None:
         self.required_capabilities += (cap.InjectStepCurrentSoma,
                                        cap.RecordMembranePotentialSoma)
         sciunit.Test.__init__(self, observation, name)
         self.output_dir = output_dir
+        # if True, figures are rendered in background processes; see figures.wait_for_figures()
+        self.defer_figures = defer_figures
+        # optional path to an SQLite database also recording all results; see davison2000unit.results_db
+        self.results_db = results_db
+        # if 'record_trace' is False, the Vm trace is neither saved nor plotted, and
+        # models with capability RecordMembranePotentialSomaStream are run in chunks
+        # of 'chunk_size' samples, keeping memory use independent of simulation length
+        self.record_trace = record_trace
+        self.chunk_size = chunk_size
+        # 'n_warmup' untimed runs are followed by 'n_repeats' timed runs;
+        # the prediction is the median of the timed runs' wall clock times
+        self.n_warmup = n_warmup
+        self.n_repeats = n_repeats
+        # optionally, also time simulations of each of the 'scaling_durations' (in ms),
+        # e.g. [1000, 5000, 15000, 60000], to separate setup from integration cost
+        self.scaling_durations = scaling_durations
 
     # ----------------------------------------------------------------------
 
@@ -43,29 +69,121 @@ class RunTime(sciunit.Test):
 
     # ----------------------------------------------------------------------
 
-    def run_stim(self, model: sciunit.Model, stim: float):
+    def run_stim(self, model: sciunit.Model, stim: float, tstop: float = 60*1000.0) -> Tuple[float, float]:
+        """Returns the (wall clock, CPU) time in seconds for the simulation"""
         stim_start = 50.0            # ms
-        stim_dur = (60*1000) - 50.0  # ms
+        stim_dur = tstop - 50.0      # ms
         stim_amp = stim              # nA
         model.inject_step_current_soma(current={'delay': stim_start,
                                                 'duration': stim_dur,
                                                 'amplitude': stim_amp})
-        start = timeit.default_timer()
+        if not self.record_trace and isinstance(model, cap.RecordMembranePotentialSomaStream):
+            spike_features = features.OnlineSpikeFeatures(stim_start=stim_start,
+                                                          stim_end=stim_start+stim_dur)
+            # the time spent in the online spike analysis is excluded, as is that of
+            # the features of full traces, computed after the timer has stopped
+            analysis_time, analysis_cpu = 0.0, 0.0
+            start, start_cpu = timeit.default_timer(), time.process_time()
+            for t_chunk, v_chunk in model.stream_membrane_potential_soma(tstop=stim_start+stim_dur,
+                                                                         chunk_size=self.chunk_size):
+                update_start, update_start_cpu = timeit.default_timer(), time.process_time()
+                spike_features.update(t_chunk, v_chunk)
+                analysis_time += timeit.default_timer() - update_start
+                analysis_cpu += time.process_time() - update_start_cpu
+            stop, stop_cpu = timeit.default_timer(), time.process_time()
+            self.spike_features = {"Spikecount_stimint": spike_features.spike_count,
+                                   "time_to_first_spike": spike_features.time_to_first_spike}
+            return stop - start - analysis_time, stop_cpu - start_cpu - analysis_cpu
+
+        start, start_cpu = timeit.default_timer(), time.process_time()
         trace = model.get_membrane_potential_soma_eFEL_format(tstop=stim_start+stim_dur,
                                                               start=stim_start,
                                                               stop=stim_start+stim_dur)
-        stop = timeit.default_timer()
-        run_time = stop - start
-        self.traces.append({"stim" : stim_amp, 
-                            "t" : trace["T"], 
-                            "v" : trace["V"]})
+        stop, stop_cpu = timeit.default_timer(), time.process_time()
+        run_time = stop - start, stop_cpu - start_cpu
+        if self.record_trace:
+            self.traces.append({"stim" : stim_amp, 
+                                "t" : trace["T"], 
+                                "v" : trace["V"]})
+        else:
+            self.spike_features = {feature: features.get_feature_values([trace], feature, interp_step=None)[0]
+                                   for feature in features.FEATURES}
         return run_time
 
+    def repeat_stim(self, model: sciunit.Model, stim: float, tstop: float) -> Dict:
+        """Times 'n_repeats' simulations and returns statistics of their run times"""
+        wall_times = []
+        cpu_times = []
+        for _ in range(max(self.n_repeats, 1)):
+            # only the trace of the last run is kept
+            self.traces = []
+            wall_time, cpu_time = self.run_stim(model, stim, tstop)
+            wall_times.append(wall_time)
+            cpu_times.append(cpu_time)
+
+        q25, median, q75 = numpy.percentile(wall_times, [25, 50, 75])
+        return {
+            "n_warmup": self.n_warmup,
+            "n_repeats": len(wall_times),
+            "wall_times": wall_times,
+            "cpu_times": cpu_times,
+            "median": float(median),
+            "iqr": float(q75 - q25),
+            "min": float(numpy.min(wall_times)),
+            "mean": float(numpy.mean(wall_times)),
+            "cpu_median": float(numpy.median(cpu_times)),
+            "cpu_wall_ratio": float(numpy.median(cpu_times) / median) if median > 0 else float("nan")
+        }
+
+    def run_scaling(self, model: sciunit.Model, stim: float, tstop: float) -> Dict:
+        """Times simulations of each of 'scaling_durations' and fits their run
+        times as: setup time + (time per simulated second * simulated seconds)"""
+        # runs of other durations must not replace the trace of the main run
+        traces, spike_features = self.traces, self.spike_features
+        durations = sorted(set(map(float, self.scaling_durations)))
+        stats = []
+        for duration in durations:
+            if duration == tstop:
+                stats.append(self.run_time_stats)
+            else:
+                stats.append(self.repeat_stim(model, stim, duration))
+        self.traces, self.spike_features = traces, spike_features
+
+        scaling = {
+            "durations": durations,
+            "median_wall_times": [stat["median"] for stat in stats],
+            "median_cpu_times": [stat["cpu_median"] for stat in stats],
+            "fit": None
+        }
+        if len(durations) > 1:
+            sim_seconds = numpy.array(durations) * 1e-3
+            wall_times = numpy.array(scaling["median_wall_times"])
+            slope, intercept = numpy.polyfit(sim_seconds, wall_times, 1)
+            residuals = wall_times - (slope * sim_seconds + intercept)
+            ss_tot = numpy.sum((wall_times - numpy.mean(wall_times))**2)
+            scaling["fit"] = {
+                "setup_time": float(intercept),
+                "time_per_simulated_second": float(slope),
+                "r_squared": float(1 - numpy.sum(residuals**2) / ss_tot) if ss_tot > 0 else float("nan")
+            }
+        return scaling
+
     def generate_prediction(self, model: sciunit.Model) -> float:
         self.traces = []
+        self.spike_features = None
+        self.scaling = None
 
         stim_inj = 0.4
-        prediction = self.run_stim(model, stim_inj)
+        tstop = 60*1000.0   # ms
+        for _ in range(self.n_warmup):
+            self.traces = []
+            self.run_stim(model, stim_inj, tstop)
+        self.run_time_stats = self.repeat_stim(model, stim_inj, tstop)
+        if self.scaling_durations:
+            self.scaling = self.run_scaling(model, stim_inj, tstop)
+
+        # the median is robust to occasional runs slowed down by other load
+        prediction = self.run_time_stats["median"]
         return prediction
 
     # ----------------------------------------------------------------------
@@ -93,25 +211,31 @@ class RunTime(sciunit.Test):
             "observation": observation,
             "prediction": prediction,
             "score": score.score,
+            "run_time_stats": self.run_time_stats
         }
+        if self.scaling is not None:
+            validation_data["scaling"] = self.scaling
+        if self.spike_features is not None:
+            validation_data["spike_features"] = self.spike_features
         with open(os.path.join(self.target_dir, 'run_time.json'), 'w') as f:
             json.dump(validation_data, f, indent=4)
         self.figures.append(os.path.join(self.target_dir, 'run_time.json'))
 
-        # 2. JSON data: save Vm vs t trace
-        with open(os.path.join(self.target_dir, 'run_time_trace.json'), 'w') as f:
-            json.dump(self.traces, f, indent=4)
-        self.figures.append(os.path.join(self.target_dir, 'run_time_trace.json'))
+        if self.traces:
+            # 2. Binary data with JSON manifest: save Vm vs t trace
+            self.figures.extend(trace_io.save_traces(self.target_dir, 'run_time_trace', self.traces))
 
-        # 3. Vm trace as pdf: somatic Vm trace during simulation
-        params = {
-            "title": "Somatic Vm: Stimulus at Soma",
-            "xlabel": "Time (ms)",
-            "ylabel": "Membrane potential (mV)"
-        }
-        traces_plot = plots.Traces(name="run_time_trace", score=score, params=params)
-        file_traces_plot = traces_plot.save_file()
-        self.figures.append(file_traces_plot)
+            # 3. Vm trace as pdf: somatic Vm trace during simulation
+            params = {
+                "title": "Somatic Vm: Stimulus at Soma",
+                "xlabel": "Time (ms)",
+                "ylabel": "Membrane potential (mV)"
+            }
+            traces_plot = plots.Traces(name="run_time_trace", score=score, params=params)
+            file_traces_plot = figures.save_figure(traces_plot, self.defer_figures)
+            self.figures.append(file_traces_plot)
 
         score.related_data["figures"] = self.figures
+        if self.results_db:
+            resultsdb.record_score(self.results_db, score)
         return score
@@ -1,17 +1,21 @@
 import os
-import efel
 import json
 import numpy
-import timeit
 import sciunit
 import davison2000unit.capabilities as cap
+import davison2000unit.checkpoint as checkpoint
+import davison2000unit.figures as figures
 import davison2000unit.plots as plots
+import davison2000unit.results_db as resultsdb
+import davison2000unit.trace_io as trace_io
+import davison2000unit.simulation as simulation
+import davison2000unit.sweep as sweep
 from davison2000unit.scores import RMSscore
-from typing import Dict, Optional
+from davison2000unit.lazy import lazy_import
+from typing import Callable, Dict, List, Optional, Tuple
 
-import functools
-# import multiprocessing
-# from multiprocessing import Pool
+# only loaded once features are extracted
+efel = lazy_import("efel")
 
 # ===============================================================================
 
@@ -29,11 +33,51 @@ class SomaFiringFrequency(sciunit.Test):
     def __init__(self,
                  observation: Dict[str, float] = {},
                  name: str = "Soma Stim Firing Frequency",
-                 output_dir: str = ".") -> None:
+                 output_dir: str = ".",
+                 n_workers: int = 1,
+                 sim_cache: Optional[simulation.SimulationCache] = None,
+                 disk_cache: bool = False,
+                 disk_cache_size: float = 1024,
+                 efel_map: Optional[Callable] = None,
+                 feature_extractor: str = "efel",
+                 plot_traces: bool = True,
+                 adaptive_sweep: bool = False,
+                 sweep_range: Optional[Tuple[float, float]] = None,
+                 sweep_max_sims: int = 20,
+                 defer_figures: bool = False,
+                 results_db: Optional[str] = None,
+                 resume: bool = False) -> None:
         self.required_capabilities += (cap.InjectStepCurrentSoma,
                                        cap.RecordMembranePotentialSoma)
         sciunit.Test.__init__(self, observation, name)
         self.output_dir = output_dir
+        # if True, figures are rendered in background processes; see figures.wait_for_figures()
+        self.defer_figures = defer_figures
+        # optional path to an SQLite database also recording all results; see davison2000unit.results_db
+        self.results_db = results_db
+        # if True, each simulated stimulus is checkpointed, and a run interrupted before
+        # completion resumes from the stimuli already simulated; see davison2000unit.checkpoint
+        self.resume = resume
+        # if 'adaptive_sweep' is True, the rheobase and a dense curve over 'sweep_range' (in nA;
+        # default spans 0 to the largest observed amplitude) are found from at most 'sweep_max_sims'
+        # simulations, and the prediction is interpolated from it; see davison2000unit.sweep
+        self.adaptive_sweep = adaptive_sweep
+        self.sweep_range = sweep_range
+        self.sweep_max_sims = sweep_max_sims
+        self.n_workers = n_workers
+        self.sim_cache = sim_cache
+        self.efel_map = efel_map
+        # 'efel', 'numpy' (see davison2000unit.features) or the name of a plugin (see davison2000unit.plugins)
+        self.feature_extractor = feature_extractor
+        # if 'plot_traces' is False, Vm traces are neither saved nor plotted, and
+        # models with capability RecordSpikeTimesSoma only record spike times, one stimulus
+        # at a time even if they have capability RecordMembranePotentialSomaBatch
+        self.plot_traces = plot_traces
+        # opt-in persistent cache of simulations, size limited to 'disk_cache_size' MB
+        self.disk_cache = None
+        if disk_cache:
+            self.disk_cache = simulation.DiskCache(os.path.join(os.path.abspath(self.output_dir), "validation_davison2000unit", ".sim_cache"),
+                                                   max_size_mb=disk_cache_size)
 
     # ----------------------------------------------------------------------
 
@@ -49,44 +93,64 @@ class SomaFiringFrequency(sciunit.Test):
 
     # ----------------------------------------------------------------------
 
-    def run_stim(self, model: sciunit.Model, stim: float):
+    def stim_protocol(self, stim: float):
         stim_start = 50.0   # ms
         stim_dur = 500.0    # ms
         stim_amp = stim     # nA
-        model.inject_step_current_soma(current={'delay': stim_start,
-                                                'duration': stim_dur,
-                                                'amplitude': stim_amp})
-        start = timeit.default_timer()
-        trace = model.get_membrane_potential_soma_eFEL_format(tstop=stim_start+stim_dur,
-                                                              start=stim_start,
-                                                              stop=stim_start+stim_dur)
-        stop = timeit.default_timer()
-        self.run_times[str(stim)] = stop - start
-        self.traces.append({"stim" : stim_amp, 
-                            "t" : trace["T"], 
-                            "v" : trace["V"]})
-        try:
-            result = efel.getFeatureValues([trace], ["Spikecount_stimint"])[
-                0]["Spikecount_stimint"][0] / (stim_dur * 1e-3)  # (Hz)
-        except:
-            result = float("nan")
-        return result
+        current = {'delay': stim_start,
+                   'duration': stim_dur,
+                   'amplitude': stim_amp}
+        return "soma", current, stim_start+stim_dur
+
+    def open_checkpoint(self, model: sciunit.Model) -> Optional[checkpoint.Checkpoint]:
+        """Returns the checkpoint of the simulations of `model` if 'resume' is True, else None"""
+        if not self.resume:
+            return None
+        return checkpoint.Checkpoint(os.path.join(os.path.abspath(self.output_dir), "validation_davison2000unit", self.name, model.name,
+                                                  'soma_stim_freq_checkpoint.jsonl'), simulation.model_id(model))
+
+    def run_stim(self, model: sciunit.Model, stim: float):
+        site, current, tstop = self.stim_protocol(stim)
+        trace = simulation.simulate_step_current(self, model, site, current, tstop,
+                                                 spikes_only=not self.plot_traces)
+        if self.plot_traces:
+            self.traces.append({"stim" : stim, 
+                                "t" : trace["T"], 
+                                "v" : trace["V"]})
+        return trace
+
+    def extract_features(self, efel_traces: List[Dict]) -> List[float]:
+        # features of all traces are extracted in a single eFEL call
+        spike_counts = simulation.extract_feature(efel_traces, "Spikecount_stimint", self.efel_map,
+                                                     self.feature_extractor)
+        results = []
+        for trace, spike_count in zip(efel_traces, spike_counts):
+            stim_dur = trace["stim_end"][0] - trace["stim_start"][0]
+            try:
+                result = spike_count / (stim_dur * 1e-3)  # (Hz)
+            except:
+                result = float("nan")
+            results.append(result)
+        return results
 
     def generate_prediction(self, model: sciunit.Model) -> Dict[float, float]:
         self.traces = []
         self.run_times = {}
+        # stimuli served from the caches, which are not part of 'run_times'
+        self.cached_stims = []
         efel.reset()
+        self.sweep_result = None
+        self.checkpoint = self.open_checkpoint(model)
         stim_list = list(map(float, self.observation.keys()))
-        run_stim_ = functools.partial(self.run_stim, model)
-
-        # multiprocessing giving errors regards to [xcb] ?!
-        # npool = multiprocessing.cpu_count() - 1
-        # with Pool(npool, maxtasksperchild=1) as pool:
-        # results = pool.map(run_stim_, stim_list, chunksize=1)
-
-        results = []
-        for stim_inj in stim_list:
-            results.append(run_stim_(stim_inj))
+        if self.adaptive_sweep:
+            sweep_range = self.sweep_range or (0.0, max(stim_list))
+            sweep_range = (min(sweep_range[0], min(stim_list)), max(sweep_range[1], max(stim_list)))
+            self.sweep_result = sweep.adaptive_sweep(self, model, sweep_range, self.sweep_max_sims)
+            results = sweep.interpolate(self.sweep_result, stim_list)
+        else:
+            # n_workers > 1 runs each stimulus in its own isolated process
+            efel_traces = simulation.run_stim_list(self, model, stim_list, self.n_workers)
+            results = self.extract_features(efel_traces)
 
         # construct prediction with structure similar to observation
         prediction = {}
@@ -114,15 +178,18 @@ class SomaFiringFrequency(sciunit.Test):
             os.makedirs(self.target_dir)
 
         # create relevant output files
-        # 1. JSON data: observation, prediction, score, run_times
+        # 1. JSON data: observation, prediction, score, run_times, cached_stims
         validation_data = {
             "obs_label": "Full model",
             "pred_label": score.model.name,
             "observation": observation,
             "prediction": prediction,
             "score": score.score,
-            "run_times" : self.run_times
+            "run_times" : self.run_times,
+            "cached_stims" : self.cached_stims
         }
+        if self.sweep_result is not None:
+            validation_data["sweep"] = self.sweep_result
         with open(os.path.join(self.target_dir, 'soma_stim_freq.json'), 'w') as f:
             json.dump(validation_data, f, indent=4)
         self.figures.append(os.path.join(self.target_dir, 'soma_stim_freq.json'))
@@ -143,23 +210,26 @@ class SomaFiringFrequency(sciunit.Test):
             "score_text": "RMS Score = " + str(round(score.score, 2))
         }
         log_plot = plots.LogPlot(name="soma_stim_freq", score=score, params=params)
-        file_log_plot = log_plot.save_file()
+        file_log_plot = figures.save_figure(log_plot, self.defer_figures)
         self.figures.append(file_log_plot)
 
-        # 3. JSON data: save Vm vs t traces
-        with open(os.path.join(self.target_dir, 'soma_stim_freq_traces.json'), 'w') as f:
-            json.dump(self.traces, f, indent=4)
-        self.figures.append(os.path.join(self.target_dir, 'soma_stim_freq_traces.json'))
+        if self.plot_traces:
+            # 3. Binary data with JSON manifest: save Vm vs t traces
+            self.figures.extend(trace_io.save_traces(self.target_dir, 'soma_stim_freq_traces', self.traces))
 
-        # 4. Vm traces as pdf: superimpose somatic Vm traces for all stimuli
-        params = {
-            "title": "Somatic Vm: Stimulus at Soma",
-            "xlabel": "Time (ms)",
-            "ylabel": "Membrane potential (mV)"
-        }
-        traces_plot = plots.Traces(name="soma_stim_freq_traces", score=score, params=params)
-        file_traces_plot = traces_plot.save_file()
-        self.figures.append(file_traces_plot)
+            # 4. Vm traces as pdf: superimpose somatic Vm traces for all stimuli
+            params = {
+                "title": "Somatic Vm: Stimulus at Soma",
+                "xlabel": "Time (ms)",
+                "ylabel": "Membrane potential (mV)"
+            }
+            traces_plot = plots.Traces(name="soma_stim_freq_traces", score=score, params=params)
+            file_traces_plot = figures.save_figure(traces_plot, self.defer_figures)
+            self.figures.append(file_traces_plot)
 
         score.related_data["figures"] = self.figures
+        if self.results_db:
+            resultsdb.record_score(self.results_db, score)
+        if self.checkpoint is not None:
+            self.checkpoint.remove()
         return score
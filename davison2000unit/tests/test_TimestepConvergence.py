@@ -0,0 +1,146 @@
+import os
+import json
+import sciunit
+import davison2000unit.capabilities as cap
+import davison2000unit.figures as figures
+import davison2000unit.plots as plots
+import davison2000unit.results_db as resultsdb
+from davison2000unit.scores import RMSscore
+from davison2000unit.tests.test_SomaFiringFrequency import SomaFiringFrequency
+from davison2000unit.tests.test_GlomFiringFrequency import GlomFiringFrequency
+from sciunit.scores import FloatScore
+from typing import Dict, List, Optional
+
+# ===============================================================================
+
+
+class TimestepConvergence(sciunit.Test):
+    """Evaluate the accuracy vs speed trade-off of the integration timestep"""
+
+    score_type: sciunit.scores = FloatScore
+    """specifies the type of score returned by the test"""
+
+    description = (
+        "Evaluate the firing frequency under step current stimulus at various integration timesteps, "
+        "and find the largest timestep whose results remain within tolerance of the finest one.")
+    """brief description of the test objective"""
+
+    def __init__(self,
+                 observation: Dict[str, float] = {},
+                 name: str = "Timestep Convergence",
+                 output_dir: str = ".",
+                 dt_list: List[float] = [0.1, 0.05, 0.025, 0.0125],
+                 tolerance: float = 1.0,
+                 stim_site: str = "soma",
+                 n_workers: int = 1,
+                 defer_figures: bool = False,
+                 results_db: Optional[str] = None) -> None:
+        if stim_site == "soma":
+            self.required_capabilities += (cap.InjectStepCurrentSoma,)
+        elif stim_site == "glomerulus":
+            self.required_capabilities += (cap.InjectStepCurrentGlomerulus,)
+        else:
+            raise ValueError("'stim_site' must be either 'soma' or 'glomerulus'!")
+        self.required_capabilities += (cap.RecordMembranePotentialSoma,
+                                       cap.SetIntegrationTimestep)
+        sciunit.Test.__init__(self, observation, name)
+        self.output_dir = output_dir
+        # if True, figures are rendered in background processes; see figures.wait_for_figures()
+        self.defer_figures = defer_figures
+        # optional path to an SQLite database also recording all results; see davison2000unit.results_db
+        self.results_db = results_db
+        # timesteps (in ms); results at the finest one are taken as reference
+        self.dt_list = sorted(map(float, dt_list), reverse=True)
+        # maximum RMS difference (in Hz) from the finest timestep's firing frequencies
+        self.tolerance = tolerance
+        self.stim_site = stim_site
+        self.n_workers = n_workers
+
+    # ----------------------------------------------------------------------
+
+    def validate_observation(self, observation: Dict[str, float]) -> None:
+        try:
+            for key, val in observation.items():
+                assert (isinstance(key, str))
+                assert (isinstance(val, int) or isinstance(val, float))
+        except Exception:
+            raise sciunit.errors.ObservationError(
+                ("Observation must return a dictionary of the form:"
+                 "{'amp1': freq1, 'amp2': freq2, ...}"))
+
+    # ----------------------------------------------------------------------
+
+    def generate_prediction(self, model: sciunit.Model) -> Dict[float, Dict]:
+        # the f-I protocol is run by the corresponding firing frequency test
+        if self.stim_site == "soma":
+            freq_test = SomaFiringFrequency(observation=self.observation, n_workers=self.n_workers,
+                                            plot_traces=False)
+        else:
+            freq_test = GlomFiringFrequency(observation=self.observation, n_workers=self.n_workers,
+                                            plot_traces=False)
+
+        original_dt = model.get_integration_timestep()
+        results = {}
+        try:
+            for dt in self.dt_list:
+                model.set_integration_timestep(dt)
+                freq_prediction = freq_test.generate_prediction(model)
+                results[dt] = {"prediction": freq_prediction,
+                               "run_times": dict(freq_test.run_times),
+                               "run_time": sum(freq_test.run_times.values())}
+        finally:
+            model.set_integration_timestep(original_dt)
+
+        reference = list(results[min(self.dt_list)]["prediction"].values())
+        for dt, result in results.items():
+            freqs = list(result["prediction"].values())
+            result["rms_vs_finest"] = RMSscore.compute(reference, freqs).score
+            result["rms_vs_observation"] = RMSscore.compute(list(self.observation.values()), freqs).score
+        return results
+
+    # ----------------------------------------------------------------------
+
+    def compute_score(self, observation: Dict[str, float], prediction: Dict[float, Dict], verbose: bool = False) -> FloatScore:
+        self.figures = []
+        # largest timestep whose results are within tolerance of the finest timestep
+        converged = [dt for dt, result in prediction.items() if result["rms_vs_finest"] <= self.tolerance]
+        score = self.score_type(max(converged) if converged else float("nan"))
+        score.description = "Largest integration timestep (in ms) with RMS difference from the finest timestep within tolerance"
+        return score
+
+    # ----------------------------------------------------------------------
+
+    def bind_score(self, score: FloatScore, model: sciunit.Model, observation: Dict[str, float], prediction: Dict[float, Dict]):
+        # create output directory
+        self.target_dir = os.path.join(os.path.abspath(self.output_dir), "validation_davison2000unit", self.name, model.name)
+        if not os.path.exists(self.target_dir):
+            os.makedirs(self.target_dir)
+
+        # create relevant output files
+        # 1. JSON data: observation, per timestep predictions, run times and errors, score
+        validation_data = {
+            "pred_label": score.model.name,
+            "stim_site": self.stim_site,
+            "tolerance": self.tolerance,
+            "observation": observation,
+            "prediction": {str(dt): result for dt, result in prediction.items()},
+            "score": score.score
+        }
+        with open(os.path.join(self.target_dir, 'timestep_convergence.json'), 'w') as f:
+            json.dump(validation_data, f, indent=4)
+        self.figures.append(os.path.join(self.target_dir, 'timestep_convergence.json'))
+
+        # 2. Pareto plot as pdf: run time vs RMS difference from finest timestep
+        params = {
+            "title": "Timestep Convergence: Run Time vs Error",
+            "xlabel": "Real time (s)",
+            "ylabel": "RMS vs finest timestep (Hz)"
+        }
+        pareto_plot = plots.ParetoPlot(name="timestep_convergence", score=score, params=params)
+        file_pareto_plot = figures.save_figure(pareto_plot, self.defer_figures)
+        self.figures.append(file_pareto_plot)
+
+        score.related_data["figures"] = self.figures
+        if self.results_db:
+            resultsdb.record_score(self.results_db, score)
+        return score
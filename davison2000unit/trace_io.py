@@ -0,0 +1,104 @@
+import os
+import json
+import numpy
+from typing import Dict, List
+
+# ===============================================================================
+
+FORMAT_NAME = "davison2000unit-traces"
+FORMAT_VERSION = 1
+
+
+def save_traces(target_dir: str, name: str, traces: List[Dict]) -> List[str]:
+    """Method to save Vm vs t traces in a compact binary format
+
+    The traces are written as two files:
+    | 1. '<name>.npz' : all samples, concatenated; 'v' as float32, and 't' as
+    |    float64 (only for traces that are not sampled at a fixed time step)
+    | 2. '<name>.json' : small manifest listing, for each trace, its stimulus
+    |    and the location of its samples in the NPZ file
+
+     Parameters
+     ----------
+     target_dir : string
+         path to directory where files are to be saved
+     name : string
+         base name (without extension) of the files
+     traces : list
+         list of traces, each a dict with keys 'stim', 't' and 'v'
+
+     Returns
+     -------
+     list
+         The absolute paths of the generated manifest and data files
+     """
+    manifest_path = os.path.join(target_dir, name + '.json')
+    data_path = os.path.join(target_dir, name + '.npz')
+
+    entries = []
+    list_t = []
+    list_v = []
+    v_offset = 0
+    t_offset = 0
+    for trace in traces:
+        t = numpy.asarray(trace["t"], dtype=numpy.float64)
+        v = numpy.asarray(trace["v"], dtype=numpy.float32)
+        entry = {"stim": trace["stim"],
+                 "length": len(v),
+                 "v_offset": v_offset}
+        # fixed time step traces only need their start time and step
+        dt = numpy.diff(t)
+        if len(t) > 1 and numpy.allclose(dt, dt[0], rtol=1e-6, atol=1e-9):
+            entry["t_start"] = float(t[0])
+            entry["dt"] = float(dt[0])
+        else:
+            entry["t_offset"] = t_offset
+            list_t.append(t)
+            t_offset += len(t)
+        list_v.append(v)
+        v_offset += len(v)
+        entries.append(entry)
+
+    numpy.savez(data_path,
+                t=numpy.concatenate(list_t) if list_t else numpy.empty(0, dtype=numpy.float64),
+                v=numpy.concatenate(list_v) if list_v else numpy.empty(0, dtype=numpy.float32))
+    manifest = {"format": FORMAT_NAME,
+                "version": FORMAT_VERSION,
+                "data_file": os.path.basename(data_path),
+                "traces": entries}
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=4)
+    return [manifest_path, data_path]
+
+
+def load_traces(manifest_path: str) -> List[Dict]:
+    """Method to load Vm vs t traces saved by :func:`save_traces`
+
+     Parameters
+     ----------
+     manifest_path : string
+         path to the JSON manifest file
+
+     Returns
+     -------
+     list
+         list of traces, each a dict with keys 'stim', 't' and 'v' (as numpy arrays)
+     """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT_NAME:
+        raise ValueError("'{}' is not a trace manifest file!".format(manifest_path))
+
+    traces = []
+    with numpy.load(os.path.join(os.path.dirname(manifest_path), manifest["data_file"])) as data:
+        all_t = data["t"]
+        all_v = data["v"]
+    for entry in manifest["traces"]:
+        length = entry["length"]
+        v = all_v[entry["v_offset"]:entry["v_offset"]+length]
+        if "dt" in entry:
+            t = entry["t_start"] + entry["dt"] * numpy.arange(length)
+        else:
+            t = all_t[entry["t_offset"]:entry["t_offset"]+length]
+        traces.append({"stim": entry["stim"], "t": t, "v": v})
+    return traces
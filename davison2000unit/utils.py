@@ -1,13 +1,145 @@
-import matplotlib.pyplot as plt
 import os
 import json
-import matplotlib
-# Force matplotlib to not use any Xwindows backend.
-matplotlib.use('Agg')
+import warnings
+# pyplot is not used, so that batch runs do not accumulate open figures
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 # ===============================================================================
 
-def create_fig7(base_dir=None, model_list=[]):
+# result files written by the tests, without the '.json' extension
+RESULT_FILES = ("soma_stim_freq", "glom_stim_freq", "soma_stim_latency", "glom_stim_latency", "run_time")
+
+# short names accepted in 'model_list' for the models from Davison et al., 2000
+MODEL_ALIASES = {"2C": "2 Compartments",
+                 "3C": "3 Compartments",
+                 "4C": "4 Compartments",
+                 "Full": "Full Model"}
+
+MODEL_STYLES = {"2 Compartments": {"color": "m", "marker": "+", "mew": 3, "markersize": 10},
+                "3 Compartments": {"color": "g", "marker": "x", "mew": 3, "markersize": 8},
+                "4 Compartments": {"color": "r", "marker": "o", "markersize": 8},
+                "Full Model": {"color": "b", "marker": "o", "markersize": 8}}
+
+# styles assigned, in turn, to any other models
+EXTRA_STYLES = [{"color": color, "marker": marker, "markersize": 8}
+                for color, marker in zip(("k", "y", "tab:orange", "tab:brown", "tab:pink", "tab:olive", "tab:gray", "tab:purple"),
+                                         ("^", "v", "D", "s", "*", "<", ">", "p"))]
+
+
+class ResultsIndex:
+    """
+    Index of all test results saved under 'validation_davison2000unit'
+
+    The directory tree is scanned once, and each result file is loaded a
+    single time, so that any number of figures can then be created from
+    memory. Models are discovered from the directory names (i.e. model names),
+    so the index is not limited to the models from Davison et al., 2000.
+
+    Results are kept per test directory (i.e. test name), so that tests run
+    under different names, writing the same result file, do not replace
+    each other. When a result file of a model is found for several tests, a
+    warning is issued, and :meth:`get` returns the one of the first test name
+    in sorted order, unless `test_name` is given.
+
+    Examples
+    --------
+    >>> index = utils.ResultsIndex(base_dir = "./validation_davison2000unit")
+    >>> index.models()
+    ['2 Compartments', '3 Compartments', '4 Compartments', 'Full Model']
+    >>> index.get("soma_stim_freq", "2 Compartments")["prediction"]
+    >>> index.get("soma_stim_freq", "2 Compartments", test_name="Soma Stim Firing Frequency (adaptive)")
+    """
+
+    def __init__(self, base_dir: str):
+        if not base_dir:
+            raise ValueError("'base_dir' not specified! Please specify the path to 'validation_davison2000unit'!")
+        self.base_dir = os.path.abspath(base_dir)
+        # {result name: {model name: {test name: contents of result file}}}
+        self.results = {name: {} for name in RESULT_FILES}
+        self._model_names = []
+
+        with os.scandir(self.base_dir) as test_entries:
+            test_dirs = sorted((entry.name, entry.path) for entry in test_entries if entry.is_dir())
+        for test_name, test_dir in test_dirs:
+            with os.scandir(test_dir) as model_entries:
+                model_dirs = sorted((entry.name, entry.path) for entry in model_entries if entry.is_dir())
+            for model_name, model_dir in model_dirs:
+                with os.scandir(model_dir) as file_entries:
+                    filenames = [entry.name for entry in file_entries if entry.is_file()]
+                for filename in filenames:
+                    name, ext = os.path.splitext(filename)
+                    if ext != ".json" or name not in self.results:
+                        continue
+                    with open(os.path.join(model_dir, filename)) as f:
+                        self.results[name].setdefault(model_name, {})[test_name] = json.load(f)
+                    if model_name not in self._model_names:
+                        self._model_names.append(model_name)
+
+        for name, model_results in self.results.items():
+            for model_name, test_results in model_results.items():
+                if len(test_results) > 1:
+                    warnings.warn("Result '{}' of model '{}' found for several tests {}; using '{}'".format(
+                        name, model_name, sorted(test_results), min(test_results)))
+
+    def models(self, model_list: list = []) -> list:
+        """Returns the names of the models in `model_list` (all models if
+        empty), with the models from Davison et al., 2000 listed first."""
+        if type(model_list) is not list:
+            raise ValueError("'model_list' must be specified as a list! Set to empty list for all models.")
+        if model_list == []:
+            known = [name for name in MODEL_STYLES if name in self._model_names]
+            return known + sorted(name for name in self._model_names if name not in MODEL_STYLES)
+        names = [MODEL_ALIASES.get(name, name) for name in model_list]
+        missing = [name for name in names if name not in self._model_names]
+        if missing:
+            raise ValueError("No results found for model(s) {} in '{}'!".format(missing, self.base_dir))
+        return names
+
+    def get(self, name: str, model_name: str, test_name: str = None):
+        """Returns the contents of result file `name` (e.g. 'soma_stim_freq')
+        for model `model_name`, written by test `test_name` (default: the
+        first test name in sorted order), or None if it was not found."""
+        test_results = self.results[name].get(model_name, {})
+        if test_name is not None:
+            return test_results.get(test_name)
+        if not test_results:
+            return None
+        return test_results[min(test_results)]
+
+    def style(self, model_name: str) -> dict:
+        """Returns the line style (color, marker) used for `model_name`."""
+        if model_name in MODEL_STYLES:
+            return MODEL_STYLES[model_name]
+        others = sorted(name for name in self._model_names if name not in MODEL_STYLES)
+        return EXTRA_STYLES[others.index(model_name) % len(EXTRA_STYLES)]
+
+# ===============================================================================
+
+def _get_index(base_dir, index):
+    if index is None:
+        index = ResultsIndex(base_dir)
+    return index
+
+
+def _plot_models(ax, index, name, model_names, key, plot_observation=False):
+    """Plots entry `key` of result file `name` for each model on axes `ax`."""
+    plot_func = ax.loglog if key == "prediction" else ax.plot
+    results = [(model_name, index.get(name, model_name)) for model_name in model_names]
+    results = [(model_name, data) for model_name, data in results if data is not None]
+
+    if plot_observation and results:
+        observation = results[0][1]["observation"]
+        plot_func(list(map(float, observation.keys())), list(
+            observation.values()), 'c', marker='s', markersize=8, label="Full Model (Davison et al., 2000)")
+
+    for model_name, data in results:
+        plot_func(list(map(float, data[key].keys())), list(
+            data[key].values()), label=data["pred_label"], **index.style(model_name))
+
+# ===============================================================================
+
+def create_fig7(base_dir=None, model_list=[], index=None):
     """Method to plot Fig. 7 from Davison et al., 2000
 
     This method will create a 2x2 multi-plot figure for soma and glom
@@ -18,11 +150,14 @@ def create_fig7(base_dir=None, model_list=[]):
      base_dir : string
          path to directory named 'validation_davison2000unit'
      model_list : list
-         list of models to be plotted (2C, 3C, 4C, Full); default is empty list and signifies all models
+         list of models to be plotted (2C, 3C, 4C, Full, or any other model name);
+         default is empty list and signifies all models
+     index : ResultsIndex
+         optional, already loaded results; avoids scanning 'base_dir' again
 
      Note
      ----
-     Tested to work with default models names and default output directories
+     Tested to work with default output directories
 
      Returns
      -------
@@ -34,308 +169,43 @@ def create_fig7(base_dir=None, model_list=[]):
      >>> fig7 = utils.create_fig7(base_dir = "./validation_davison2000unit")
      """
 
-    if not base_dir:
-        raise ValueError("'base_dir' not specified! Please specify the path to 'validation_davison2000unit'!")
-    if type(model_list) is not list:
-        raise ValueError("'model_list' must be specified as a list! Set to empty list for all models.")
-
-    flag_2C = False
-    flag_3C = False
-    flag_4C = False
-    flag_Full = False
-    if model_list == []:
-        flag_2C = True
-        flag_3C = True
-        flag_4C = True
-        flag_Full = True
-    else:
-        if "2C" in model_list:
-            flag_2C = True
-        if "3C" in model_list:
-            flag_3C = True
-        if "4C" in model_list:
-            flag_4C = True
-        if "Full" in model_list:
-            flag_Full = True
-
-    fig, axs = plt.subplots(2, 2, figsize=(10*2, 7*2))
-
-    # ----------------------------------------------------------------------
-    # SomaFiringFrequency
-
-    json_soma_stim_freq = {}
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim Firing Frequency", "2 Compartments", "soma_stim_freq.json")) as f:
-            json_soma_stim_freq_2C = json.load(f)
-        label_2C = json_soma_stim_freq_2C["pred_label"]
-        json_soma_stim_freq[label_2C] = json_soma_stim_freq_2C["prediction"]
-        label_obs = json_soma_stim_freq_2C["obs_label"]
-        json_soma_stim_freq[label_obs] = json_soma_stim_freq_2C["observation"]
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim Firing Frequency", "3 Compartments", "soma_stim_freq.json")) as f:
-            json_soma_stim_freq_3C = json.load(f)
-        label_3C = json_soma_stim_freq_3C["pred_label"]
-        json_soma_stim_freq[label_3C] = json_soma_stim_freq_3C["prediction"]
-        if not flag_2C:
-            label_obs = json_soma_stim_freq_3C["obs_label"]
-            json_soma_stim_freq[label_obs] = json_soma_stim_freq_3C["observation"]
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim Firing Frequency", "4 Compartments", "soma_stim_freq.json")) as f:
-            json_soma_stim_freq_4C = json.load(f)
-        label_4C = json_soma_stim_freq_4C["pred_label"]
-        json_soma_stim_freq[label_4C] = json_soma_stim_freq_4C["prediction"]
-        if not flag_2C and not flag_3C:
-            label_obs = json_soma_stim_freq_4C["obs_label"]
-            json_soma_stim_freq[label_obs] = json_soma_stim_freq_4C["observation"]
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim Firing Frequency", "Full Model", "soma_stim_freq.json")) as f:
-            json_soma_stim_freq_Full = json.load(f)
-        label_Full = json_soma_stim_freq_Full["pred_label"]
-        json_soma_stim_freq[label_Full] = json_soma_stim_freq_Full["prediction"]
-        if not flag_2C and not flag_3C and not flag_4C:
-            label_obs = json_soma_stim_freq_Full["obs_label"]
-            json_soma_stim_freq[label_obs] = json_soma_stim_freq_Full["observation"]
-
-    axs[0, 0].loglog(list(map(float, json_soma_stim_freq[label_obs].keys())), list(
-        json_soma_stim_freq[label_obs].values()), 'c', marker='s', markersize=8, label="Full Model (Davison et al., 2000)")
-
-    if flag_2C:
-        axs[0, 0].loglog(list(map(float, json_soma_stim_freq[label_2C].keys())), list(
-            json_soma_stim_freq[label_2C].values()), 'm', marker='+', mew=3, markersize=10, label=label_2C)
-
-    if flag_3C:
-        axs[0, 0].loglog(list(map(float, json_soma_stim_freq[label_3C].keys())), list(
-            json_soma_stim_freq[label_3C].values()), 'g', marker='x', mew=3, markersize=8, label=label_3C)
-
-    if flag_4C:
-        axs[0, 0].loglog(list(map(float, json_soma_stim_freq[label_4C].keys())), list(
-            json_soma_stim_freq[label_4C].values()), 'r', marker='o', markersize=8, label=label_4C)
-
-    if flag_Full:
-        axs[0, 0].loglog(list(map(float, json_soma_stim_freq[label_Full].keys())), list(
-            json_soma_stim_freq[label_Full].values()), 'b', marker='o', markersize=8, label=label_Full)
-
-    axs[0, 0].set_title("Stimulus at Soma: Firing Frequency", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
-    axs[0, 0].set_xlim([0.15, 3.0])
-    axs[0, 0].set_ylim([10.0, 200.0])
-    axs[0, 0].set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
-    axs[0, 0].set_ylabel("Firing frequency (Hz)", fontsize=18)
-    axs[0, 0].set_xticks([0.2, 0.4, 0.8, 1.6])
-    axs[0, 0].set_xticklabels([0.2, 0.4, 0.8, 1.6])
-    axs[0, 0].set_yticks([10, 100])
-    axs[0, 0].set_yticklabels([10, 100])
-    axs[0, 0].tick_params(axis='both', which='major', labelsize=14)
-    axs[0, 0].legend(loc="best", prop={'size': 14})
-
-    # ----------------------------------------------------------------------
-    # GlomFiringFrequency
-
-    json_glom_stim_freq = {}
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim Firing Frequency", "2 Compartments", "glom_stim_freq.json")) as f:
-            json_glom_stim_freq_2C = json.load(f)
-        label_2C = json_glom_stim_freq_2C["pred_label"]
-        json_glom_stim_freq[label_2C] = json_glom_stim_freq_2C["prediction"]
-        label_obs = json_glom_stim_freq_2C["obs_label"]
-        json_glom_stim_freq[label_obs] = json_glom_stim_freq_2C["observation"]
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim Firing Frequency", "3 Compartments", "glom_stim_freq.json")) as f:
-            json_glom_stim_freq_3C = json.load(f)
-        label_3C = json_glom_stim_freq_3C["pred_label"]
-        json_glom_stim_freq[label_3C] = json_glom_stim_freq_3C["prediction"]
-        if not flag_2C:
-            label_obs = json_glom_stim_freq_3C["obs_label"]
-            json_glom_stim_freq[label_obs] = json_glom_stim_freq_3C["observation"]
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim Firing Frequency", "4 Compartments", "glom_stim_freq.json")) as f:
-            json_glom_stim_freq_4C = json.load(f)
-        label_4C = json_glom_stim_freq_4C["pred_label"]
-        json_glom_stim_freq[label_4C] = json_glom_stim_freq_4C["prediction"]
-        if not flag_2C and not flag_3C:
-            label_obs = json_glom_stim_freq_4C["obs_label"]
-            json_glom_stim_freq[label_obs] = json_glom_stim_freq_4C["observation"]
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim Firing Frequency", "Full Model", "glom_stim_freq.json")) as f:
-            json_glom_stim_freq_Full = json.load(f)
-        label_Full = json_glom_stim_freq_Full["pred_label"]
-        json_glom_stim_freq[label_Full] = json_glom_stim_freq_Full["prediction"]
-        if not flag_2C and not flag_3C and not flag_4C:
-            label_obs = json_glom_stim_freq_Full["obs_label"]
-            json_glom_stim_freq[label_obs] = json_glom_stim_freq_Full["observation"]
-    
-    axs[0, 1].loglog(list(map(float, json_glom_stim_freq[label_obs].keys())), list(
-        json_glom_stim_freq[label_obs].values()), 'c', marker='s', markersize=8, label="Full Model (Davison et al., 2000)")
-
-    if flag_2C:
-        axs[0, 1].loglog(list(map(float, json_glom_stim_freq[label_2C].keys())), list(
-            json_glom_stim_freq[label_2C].values()), 'm', marker='+', mew=3, markersize=10, label=label_2C)
-
-    if flag_3C:
-        axs[0, 1].loglog(list(map(float, json_glom_stim_freq[label_3C].keys())), list(
-            json_glom_stim_freq[label_3C].values()), 'g', marker='x', mew=3, markersize=8, label=label_3C)
-
-    if flag_4C:
-        axs[0, 1].loglog(list(map(float, json_glom_stim_freq[label_4C].keys())), list(
-            json_glom_stim_freq[label_4C].values()), 'r', marker='o', markersize=8, label=label_4C)
-    
-    if flag_Full:
-        axs[0, 1].loglog(list(map(float, json_glom_stim_freq[label_Full].keys())), list(
-            json_glom_stim_freq[label_Full].values()), 'b', marker='o', markersize=8, label=label_Full)
-
-    axs[0, 1].set_title("Stimulus at Glomerulus: Firing Frequency", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
-    axs[0, 1].set_xlim([0.15, 3.0])
-    axs[0, 1].set_ylim([10.0, 200.0])
-    axs[0, 1].set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
-    axs[0, 1].set_ylabel("Firing frequency (Hz)", fontsize=18)
-    axs[0, 1].set_xticks([0.2, 0.4, 0.8, 1.6])
-    axs[0, 1].set_xticklabels([0.2, 0.4, 0.8, 1.6])
-    axs[0, 1].set_yticks([10, 100])
-    axs[0, 1].set_yticklabels([10, 100])
-    axs[0, 1].tick_params(axis='both', which='major', labelsize=14)
-    axs[0, 1].legend(loc="best", prop={'size': 14})
-
-    # ----------------------------------------------------------------------
-    # SomaFirstSpikeLatency
-
-    json_soma_stim_latency = {}
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim First Spike Latency", "2 Compartments", "soma_stim_latency.json")) as f:
-            json_soma_stim_latency_2C = json.load(f)
-        label_2C = json_soma_stim_latency_2C["pred_label"]
-        json_soma_stim_latency[label_2C] = json_soma_stim_latency_2C["prediction"]
-        label_obs = json_soma_stim_latency_2C["obs_label"]
-        json_soma_stim_latency[label_obs] = json_soma_stim_latency_2C["observation"]
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim First Spike Latency", "3 Compartments", "soma_stim_latency.json")) as f:
-            json_soma_stim_latency_3C = json.load(f)
-        label_3C = json_soma_stim_latency_3C["pred_label"]
-        json_soma_stim_latency[label_3C] = json_soma_stim_latency_3C["prediction"]
-        if not flag_2C:
-            label_obs = json_soma_stim_latency_3C["obs_label"]
-            json_soma_stim_latency[label_obs] = json_soma_stim_latency_3C["observation"]
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim First Spike Latency", "4 Compartments", "soma_stim_latency.json")) as f:
-            json_soma_stim_latency_4C = json.load(f)
-        label_4C = json_soma_stim_latency_4C["pred_label"]
-        json_soma_stim_latency[label_4C] = json_soma_stim_latency_4C["prediction"]
-        if not flag_2C and not flag_3C:
-            label_obs = json_soma_stim_latency_4C["obs_label"]
-            json_soma_stim_latency[label_obs] = json_soma_stim_latency_4C["observation"]
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim First Spike Latency", "Full Model", "soma_stim_latency.json")) as f:
-            json_soma_stim_latency_Full = json.load(f)
-        label_Full = json_soma_stim_latency_Full["pred_label"]
-        json_soma_stim_latency[label_Full] = json_soma_stim_latency_Full["prediction"]
-        if not flag_2C and not flag_3C:
-            label_obs = json_soma_stim_latency_Full["obs_label"]
-            json_soma_stim_latency[label_obs] = json_soma_stim_latency_Full["observation"]
-    
-    axs[1, 0].loglog(list(map(float, json_soma_stim_latency[label_obs].keys())), list(
-        json_soma_stim_latency[label_obs].values()), 'c', marker='s', markersize=8, label="Full Model (Davison et al., 2000)")
-
-    if flag_2C:
-        axs[1, 0].loglog(list(map(float, json_soma_stim_latency[label_2C].keys())), list(
-            json_soma_stim_latency[label_2C].values()), 'm', marker='+', mew=3, markersize=10, label=label_2C)
-
-    if flag_3C:
-        axs[1, 0].loglog(list(map(float, json_soma_stim_latency[label_3C].keys())), list(
-            json_soma_stim_latency[label_3C].values()), 'g', marker='x', mew=3, markersize=8, label=label_3C)
-
-    if flag_4C:
-        axs[1, 0].loglog(list(map(float, json_soma_stim_latency[label_4C].keys())), list(
-            json_soma_stim_latency[label_4C].values()), 'r', marker='o', markersize=8, label=label_4C)
-
-    if flag_Full:
-        axs[1, 0].loglog(list(map(float, json_soma_stim_latency[label_Full].keys())), list(
-            json_soma_stim_latency[label_Full].values()), 'b', marker='o', markersize=8, label=label_Full)
-
-    axs[1, 0].set_title("Stimulus at Soma: First Spike Latency", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
-    axs[1, 0].set_xlim([0.15, 3.0])
-    axs[1, 0].set_ylim([3.0, 150.0])
-    axs[1, 0].set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
-    axs[1, 0].set_ylabel("First spike latency (ms)", fontsize=18)
-    axs[1, 0].set_xticks([0.2, 0.4, 0.8, 1.6])
-    axs[1, 0].set_xticklabels([0.2, 0.4, 0.8, 1.6])
-    axs[1, 0].set_yticks([10, 100])
-    axs[1, 0].set_yticklabels([10, 100])
-    axs[1, 0].tick_params(axis='both', which='major', labelsize=14)
-    axs[1, 0].legend(loc="best", prop={'size': 14})
-
-    # ----------------------------------------------------------------------
-    # GlomFirstSpikeLatency
-
-    json_glom_stim_latency = {}
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim First Spike Latency", "2 Compartments", "glom_stim_latency.json")) as f:
-            json_glom_stim_latency_2C = json.load(f)
-        label_2C = json_glom_stim_latency_2C["pred_label"]
-        json_glom_stim_latency[label_2C] = json_glom_stim_latency_2C["prediction"]
-        label_obs = json_glom_stim_latency_2C["obs_label"]
-        json_glom_stim_latency[label_obs] = json_glom_stim_latency_2C["observation"]
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim First Spike Latency", "3 Compartments", "glom_stim_latency.json")) as f:
-            json_glom_stim_latency_3C = json.load(f)
-        label_3C = json_glom_stim_latency_3C["pred_label"]
-        json_glom_stim_latency[label_3C] = json_glom_stim_latency_3C["prediction"]
-        if not flag_2C:
-            label_obs = json_glom_stim_latency_3C["obs_label"]
-            json_glom_stim_latency[label_obs] = json_glom_stim_latency_3C["observation"]
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim First Spike Latency", "4 Compartments", "glom_stim_latency.json")) as f:
-            json_glom_stim_latency_4C = json.load(f)
-        label_4C = json_glom_stim_latency_4C["pred_label"]
-        json_glom_stim_latency[label_4C] = json_glom_stim_latency_4C["prediction"]
-        if not flag_2C and not flag_3C:
-            label_obs = json_glom_stim_latency_4C["obs_label"]
-            json_glom_stim_latency[label_obs] = json_glom_stim_latency_4C["observation"]
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim First Spike Latency", "Full Model", "glom_stim_latency.json")) as f:
-            json_glom_stim_latency_Full = json.load(f)
-        label_Full = json_glom_stim_latency_Full["pred_label"]
-        json_glom_stim_latency[label_Full] = json_glom_stim_latency_Full["prediction"]
-        if not flag_2C and not flag_3C and not flag_Full:
-            label_obs = json_glom_stim_latency_Full["obs_label"]
-            json_glom_stim_latency[label_obs] = json_glom_stim_latency_Full["observation"]
-
-    axs[1, 1].loglog(list(map(float, json_glom_stim_latency[label_obs].keys())), list(
-        json_glom_stim_latency[label_obs].values()), 'c', marker='s', markersize=8, label="Full Model (Davison et al., 2000)")
-
-    if flag_2C:
-        axs[1, 1].loglog(list(map(float, json_glom_stim_latency[label_2C].keys())), list(
-            json_glom_stim_latency[label_2C].values()), 'm', marker='+', mew=3, markersize=10, label=label_2C)
-
-    if flag_3C:
-        axs[1, 1].loglog(list(map(float, json_glom_stim_latency[label_3C].keys())), list(
-            json_glom_stim_latency[label_3C].values()), 'g', marker='x', mew=3, markersize=8, label=label_3C)
-
-    if flag_4C:
-        axs[1, 1].loglog(list(map(float, json_glom_stim_latency[label_4C].keys())), list(
-            json_glom_stim_latency[label_4C].values()), 'r', marker='o', markersize=8, label=label_4C)
-        
-    if flag_Full:
-        axs[1, 1].loglog(list(map(float, json_glom_stim_latency[label_Full].keys())), list(
-            json_glom_stim_latency[label_Full].values()), 'b', marker='o', markersize=8, label=label_Full)
-
-    axs[1, 1].set_title("Stimulus at Glomerulus: First Spike Latency", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
-    axs[1, 1].set_xlim([0.15, 3.0])
-    axs[1, 1].set_ylim([3.0, 150.0])
-    axs[1, 1].set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
-    axs[1, 1].set_ylabel("First spike latency (ms)", fontsize=18)
-    axs[1, 1].set_xticks([0.2, 0.4, 0.8, 1.6])
-    axs[1, 1].set_xticklabels([0.2, 0.4, 0.8, 1.6])
-    axs[1, 1].set_yticks([10, 100])
-    axs[1, 1].set_yticklabels([10, 100])
-    axs[1, 1].tick_params(axis='both', which='major', labelsize=14)
-    axs[1, 1].legend(loc="best", prop={'size': 14})
+    index = _get_index(base_dir, index)
+    model_names = index.models(model_list)
+
+    fig = Figure(figsize=(10*2, 7*2))
+    FigureCanvasAgg(fig)
+    axs = fig.subplots(2, 2)
+
+    panels = [(axs[0, 0], "soma_stim_freq", "Stimulus at Soma: Firing Frequency"),
+              (axs[0, 1], "glom_stim_freq", "Stimulus at Glomerulus: Firing Frequency"),
+              (axs[1, 0], "soma_stim_latency", "Stimulus at Soma: First Spike Latency"),
+              (axs[1, 1], "glom_stim_latency", "Stimulus at Glomerulus: First Spike Latency")]
+    for ax, name, title in panels:
+        _plot_models(ax, index, name, model_names, "prediction", plot_observation=True)
+        ax.set_title(title, {"fontsize": 20, "fontweight" : "bold"}, pad=25)
+        ax.set_xlim([0.15, 3.0])
+        ax.set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
+        if name.endswith("freq"):
+            ax.set_ylim([10.0, 200.0])
+            ax.set_ylabel("Firing frequency (Hz)", fontsize=18)
+        else:
+            ax.set_ylim([3.0, 150.0])
+            ax.set_ylabel("First spike latency (ms)", fontsize=18)
+        ax.set_xticks([0.2, 0.4, 0.8, 1.6])
+        ax.set_xticklabels([0.2, 0.4, 0.8, 1.6])
+        ax.set_yticks([10, 100])
+        ax.set_yticklabels([10, 100])
+        ax.tick_params(axis='both', which='major', labelsize=14)
+        ax.legend(loc="best", prop={'size': 14})
 
     fig.tight_layout(h_pad=5, w_pad=5)
-    filepath = os.path.join(os.path.abspath(base_dir), 'figure_7.pdf')
-    plt.savefig(filepath, dpi=600, bbox_inches= "tight")
+    filepath = os.path.join(index.base_dir, 'figure_7.pdf')
+    fig.savefig(filepath, dpi=600, bbox_inches= "tight")
     return filepath
 
 # ===============================================================================
 
-def create_fig7_runtimes(base_dir=None, model_list=[]):
+def create_fig7_runtimes(base_dir=None, model_list=[], index=None):
     """Method to plot run times for models from Davison et al., 2000
 
     This method will create a 2x2 multi-plot figure for run-times for the various simulations.
@@ -345,11 +215,14 @@ def create_fig7_runtimes(base_dir=None, model_list=[]):
      base_dir : string
          path to directory named 'validation_davison2000unit'
      model_list : list
-         list of models to be plotted (2C, 3C, 4C, Full); default is empty list and signifies all models
+         list of models to be plotted (2C, 3C, 4C, Full, or any other model name);
+         default is empty list and signifies all models
+     index : ResultsIndex
+         optional, already loaded results; avoids scanning 'base_dir' again
 
      Note
      ----
-     Tested to work with default models names and default output directories
+     Tested to work with default output directories
 
      Returns
      -------
@@ -361,228 +234,33 @@ def create_fig7_runtimes(base_dir=None, model_list=[]):
      >>> fig7 = utils.create_fig7_runtimes(base_dir = "./validation_davison2000unit")
      """
 
-    if not base_dir:
-        raise ValueError("'base_dir' not specified! Please specify the path to 'validation_davison2000unit'!")
-    if type(model_list) is not list:
-        raise ValueError("'model_list' must be specified as a list! Set to empty list for all models.")
-
-    flag_2C = False
-    flag_3C = False
-    flag_4C = False
-    flag_Full = False
-    if model_list == []:
-        flag_2C = True
-        flag_3C = True
-        flag_4C = True
-        flag_Full = True
-    else:
-        if "2C" in model_list:
-            flag_2C = True
-        if "3C" in model_list:
-            flag_3C = True
-        if "4C" in model_list:
-            flag_4C = True
-        if "Full" in model_list:
-            flag_Full = True
-
-    fig, axs = plt.subplots(2, 2, figsize=(10*2, 7*2))
-
-    # ----------------------------------------------------------------------
-    # SomaFiringFrequency
-
-    json_soma_stim_freq = {}
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim Firing Frequency", "2 Compartments", "soma_stim_freq.json")) as f:
-            json_soma_stim_freq_2C = json.load(f)
-        label_2C = json_soma_stim_freq_2C["pred_label"]
-        json_soma_stim_freq[label_2C] = json_soma_stim_freq_2C["run_times"]
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim Firing Frequency", "3 Compartments", "soma_stim_freq.json")) as f:
-            json_soma_stim_freq_3C = json.load(f)
-        label_3C = json_soma_stim_freq_3C["pred_label"]
-        json_soma_stim_freq[label_3C] = json_soma_stim_freq_3C["run_times"]
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim Firing Frequency", "4 Compartments", "soma_stim_freq.json")) as f:
-            json_soma_stim_freq_4C = json.load(f)
-        label_4C = json_soma_stim_freq_4C["pred_label"]
-        json_soma_stim_freq[label_4C] = json_soma_stim_freq_4C["run_times"]
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim Firing Frequency", "Full Model", "soma_stim_freq.json")) as f:
-            json_soma_stim_freq_Full = json.load(f)
-        label_Full = json_soma_stim_freq_Full["pred_label"]
-        json_soma_stim_freq[label_Full] = json_soma_stim_freq_Full["run_times"]
-
-    if flag_2C:
-        axs[0, 0].plot(list(map(float, json_soma_stim_freq[label_2C].keys())), list(
-            json_soma_stim_freq[label_2C].values()), 'm', marker='+', mew=3, markersize=10, label=label_2C)
-
-    if flag_3C:
-        axs[0, 0].plot(list(map(float, json_soma_stim_freq[label_3C].keys())), list(
-            json_soma_stim_freq[label_3C].values()), 'g', marker='x', mew=3, markersize=8, label=label_3C)
-
-    if flag_4C:
-        axs[0, 0].plot(list(map(float, json_soma_stim_freq[label_4C].keys())), list(
-            json_soma_stim_freq[label_4C].values()), 'r', marker='o', markersize=8, label=label_4C)
-    
-    if flag_Full:
-        axs[0, 0].plot(list(map(float, json_soma_stim_freq[label_Full].keys())), list(
-            json_soma_stim_freq[label_Full].values()), 'b', marker='o', markersize=8, label=label_Full)
-
-    axs[0, 0].set_title("Stimulus at Soma: Firing Frequency", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
-    axs[0, 0].set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
-    axs[0, 0].set_ylabel("Real time (s)", fontsize=18)
-    axs[0, 0].tick_params(axis='both', which='major', labelsize=14)
-    axs[0, 0].legend(loc="best", prop={'size': 14})
-
-    # ----------------------------------------------------------------------
-    # GlomFiringFrequency
-
-    json_glom_stim_freq = {}
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim Firing Frequency", "2 Compartments", "glom_stim_freq.json")) as f:
-            json_glom_stim_freq_2C = json.load(f)
-        label_2C = json_glom_stim_freq_2C["pred_label"]
-        json_glom_stim_freq[label_2C] = json_glom_stim_freq_2C["run_times"]
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim Firing Frequency", "3 Compartments", "glom_stim_freq.json")) as f:
-            json_glom_stim_freq_3C = json.load(f)
-        label_3C = json_glom_stim_freq_3C["pred_label"]
-        json_glom_stim_freq[label_3C] = json_glom_stim_freq_3C["run_times"]
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim Firing Frequency", "4 Compartments", "glom_stim_freq.json")) as f:
-            json_glom_stim_freq_4C = json.load(f)
-        label_4C = json_glom_stim_freq_4C["pred_label"]
-        json_glom_stim_freq[label_4C] = json_glom_stim_freq_4C["run_times"]
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim Firing Frequency", "Full Model", "glom_stim_freq.json")) as f:
-            json_glom_stim_freq_Full = json.load(f)
-        label_Full = json_glom_stim_freq_Full["pred_label"]
-        json_glom_stim_freq[label_Full] = json_glom_stim_freq_Full["run_times"]
-    
-    if flag_2C:
-        axs[0, 1].plot(list(map(float, json_glom_stim_freq[label_2C].keys())), list(
-            json_glom_stim_freq[label_2C].values()), 'm', marker='+', mew=3, markersize=10, label=label_2C)
-
-    if flag_3C:
-        axs[0, 1].plot(list(map(float, json_glom_stim_freq[label_3C].keys())), list(
-            json_glom_stim_freq[label_3C].values()), 'g', marker='x', mew=3, markersize=8, label=label_3C)
-
-    if flag_4C:
-        axs[0, 1].plot(list(map(float, json_glom_stim_freq[label_4C].keys())), list(
-            json_glom_stim_freq[label_4C].values()), 'r', marker='o', markersize=8, label=label_4C)
-
-    if flag_Full:
-        axs[0, 1].plot(list(map(float, json_glom_stim_freq[label_Full].keys())), list(
-            json_glom_stim_freq[label_Full].values()), 'b', marker='o', markersize=8, label=label_Full)
-
-    axs[0, 1].set_title("Stimulus at Glomerulus: Firing Frequency", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
-    axs[0, 1].set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
-    axs[0, 1].set_ylabel("Real time (s)", fontsize=18)
-    axs[0, 1].tick_params(axis='both', which='major', labelsize=14)
-    axs[0, 1].legend(loc="best", prop={'size': 14})
-
-    # ----------------------------------------------------------------------
-    # SomaFirstSpikeLatency
-
-    json_soma_stim_latency = {}
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim First Spike Latency", "2 Compartments", "soma_stim_latency.json")) as f:
-            json_soma_stim_latency_2C = json.load(f)
-        label_2C = json_soma_stim_latency_2C["pred_label"]
-        json_soma_stim_latency[label_2C] = json_soma_stim_latency_2C["run_times"]
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim First Spike Latency", "3 Compartments", "soma_stim_latency.json")) as f:
-            json_soma_stim_latency_3C = json.load(f)
-        label_3C = json_soma_stim_latency_3C["pred_label"]
-        json_soma_stim_latency[label_3C] = json_soma_stim_latency_3C["run_times"]
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim First Spike Latency", "4 Compartments", "soma_stim_latency.json")) as f:
-            json_soma_stim_latency_4C = json.load(f)
-        label_4C = json_soma_stim_latency_4C["pred_label"]
-        json_soma_stim_latency[label_4C] = json_soma_stim_latency_4C["run_times"]
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Soma Stim First Spike Latency", "Full Model", "soma_stim_latency.json")) as f:
-            json_soma_stim_latency_Full = json.load(f)
-        label_Full = json_soma_stim_latency_Full["pred_label"]
-        json_soma_stim_latency[label_Full] = json_soma_stim_latency_Full["run_times"]
-    
-    if flag_2C:
-        axs[1, 0].plot(list(map(float, json_soma_stim_latency[label_2C].keys())), list(
-            json_soma_stim_latency[label_2C].values()), 'm', marker='+', mew=3, markersize=10, label=label_2C)
-
-    if flag_3C:
-        axs[1, 0].plot(list(map(float, json_soma_stim_latency[label_3C].keys())), list(
-            json_soma_stim_latency[label_3C].values()), 'g', marker='x', mew=3, markersize=8, label=label_3C)
-
-    if flag_4C:
-        axs[1, 0].plot(list(map(float, json_soma_stim_latency[label_4C].keys())), list(
-            json_soma_stim_latency[label_4C].values()), 'r', marker='o', markersize=8, label=label_4C)
-
-    if flag_Full:
-        axs[1, 0].plot(list(map(float, json_soma_stim_latency[label_Full].keys())), list(
-            json_soma_stim_latency[label_Full].values()), 'b', marker='o', markersize=8, label=label_Full)
-
-    axs[1, 0].set_title("Stimulus at Soma: First Spike Latency", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
-    axs[1, 0].set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
-    axs[1, 0].set_ylabel("Real time (s)", fontsize=18)
-    axs[1, 0].tick_params(axis='both', which='major', labelsize=14)
-    axs[1, 0].legend(loc="best", prop={'size': 14})
-
-    # ----------------------------------------------------------------------
-    # GlomFirstSpikeLatency
-
-    json_glom_stim_latency = {}
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim First Spike Latency", "2 Compartments", "glom_stim_latency.json")) as f:
-            json_glom_stim_latency_2C = json.load(f)
-        label_2C = json_glom_stim_latency_2C["pred_label"]
-        json_glom_stim_latency[label_2C] = json_glom_stim_latency_2C["run_times"]
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim First Spike Latency", "3 Compartments", "glom_stim_latency.json")) as f:
-            json_glom_stim_latency_3C = json.load(f)
-        label_3C = json_glom_stim_latency_3C["pred_label"]
-        json_glom_stim_latency[label_3C] = json_glom_stim_latency_3C["run_times"]
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim First Spike Latency", "4 Compartments", "glom_stim_latency.json")) as f:
-            json_glom_stim_latency_4C = json.load(f)
-        label_4C = json_glom_stim_latency_4C["pred_label"]
-        json_glom_stim_latency[label_4C] = json_glom_stim_latency_4C["run_times"]
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Glom Stim First Spike Latency", "Full Model", "glom_stim_latency.json")) as f:
-            json_glom_stim_latency_Full = json.load(f)
-        label_Full = json_glom_stim_latency_Full["pred_label"]
-        json_glom_stim_latency[label_Full] = json_glom_stim_latency_Full["run_times"]
-
-    if flag_2C:
-        axs[1, 1].plot(list(map(float, json_glom_stim_latency[label_2C].keys())), list(
-            json_glom_stim_latency[label_2C].values()), 'm', marker='+', mew=3, markersize=10, label=label_2C)
-
-    if flag_3C:
-        axs[1, 1].plot(list(map(float, json_glom_stim_latency[label_3C].keys())), list(
-            json_glom_stim_latency[label_3C].values()), 'g', marker='x', mew=3, markersize=8, label=label_3C)
-
-    if flag_4C:
-        axs[1, 1].plot(list(map(float, json_glom_stim_latency[label_4C].keys())), list(
-            json_glom_stim_latency[label_4C].values()), 'r', marker='o', markersize=8, label=label_4C)
-    
-    if flag_Full:
-        axs[1, 1].plot(list(map(float, json_glom_stim_latency[label_Full].keys())), list(
-            json_glom_stim_latency[label_Full].values()), 'b', marker='o', markersize=8, label=label_Full)
-
-    axs[1, 1].set_title("Stimulus at Glomerulus: First Spike Latency", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
-    axs[1, 1].set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
-    axs[1, 1].set_ylabel("Real time (s)", fontsize=18)
-    axs[1, 1].tick_params(axis='both', which='major', labelsize=14)
-    axs[1, 1].legend(loc="best", prop={'size': 14})
+    index = _get_index(base_dir, index)
+    model_names = index.models(model_list)
+
+    fig = Figure(figsize=(10*2, 7*2))
+    FigureCanvasAgg(fig)
+    axs = fig.subplots(2, 2)
+
+    panels = [(axs[0, 0], "soma_stim_freq", "Stimulus at Soma: Firing Frequency"),
+              (axs[0, 1], "glom_stim_freq", "Stimulus at Glomerulus: Firing Frequency"),
+              (axs[1, 0], "soma_stim_latency", "Stimulus at Soma: First Spike Latency"),
+              (axs[1, 1], "glom_stim_latency", "Stimulus at Glomerulus: First Spike Latency")]
+    for ax, name, title in panels:
+        _plot_models(ax, index, name, model_names, "run_times")
+        ax.set_title(title, {"fontsize": 20, "fontweight" : "bold"}, pad=25)
+        ax.set_xlabel("Injected current ($\mu$A/cm$^2$)", fontsize=18)
+        ax.set_ylabel("Real time (s)", fontsize=18)
+        ax.tick_params(axis='both', which='major', labelsize=14)
+        ax.legend(loc="best", prop={'size': 14})
 
     fig.tight_layout(h_pad=5, w_pad=5)
-    filepath = os.path.join(os.path.abspath(base_dir), 'figure7_runtimes.pdf')
-    plt.savefig(filepath, dpi=600, bbox_inches= "tight")
+    filepath = os.path.join(index.base_dir, 'figure7_runtimes.pdf')
+    fig.savefig(filepath, dpi=600, bbox_inches= "tight")
     return filepath
 
 # ===============================================================================
 
-def create_fig_runtimes(base_dir=None, model_list=[]):
+def create_fig_runtimes(base_dir=None, model_list=[], index=None):
     """Method to plot run times for models from Davison et al., 2000
 
     This method will create a bar plot of all models with data from Test 'RunTime' .
@@ -592,11 +270,14 @@ def create_fig_runtimes(base_dir=None, model_list=[]):
      base_dir : string
          path to directory named 'validation_davison2000unit'
      model_list : list
-         list of models to be plotted (2C, 3C, 4C, Full); default is empty list and signifies all models
+         list of models to be plotted (2C, 3C, 4C, Full, or any other model name);
+         default is empty list and signifies all models
+     index : ResultsIndex
+         optional, already loaded results; avoids scanning 'base_dir' again
 
      Note
      ----
-     Tested to work with default models names and default output directories
+     Tested to work with default output directories
 
      Returns
      -------
@@ -608,61 +289,25 @@ def create_fig_runtimes(base_dir=None, model_list=[]):
      >>> fig = utils.create_fig_runtimes(base_dir = "./validation_davison2000unit")
      """
 
-    if not base_dir:
-        raise ValueError("'base_dir' not specified! Please specify the path to 'validation_davison2000unit'!")
-    if type(model_list) is not list:
-        raise ValueError("'model_list' must be specified as a list! Set to empty list for all models.")
-
-    flag_2C = False
-    flag_3C = False
-    flag_4C = False
-    flag_Full = False
-    if model_list == []:
-        flag_2C = True
-        flag_3C = True
-        flag_4C = True
-        flag_Full = True
-    else:
-        if "2C" in model_list:
-            flag_2C = True
-        if "3C" in model_list:
-            flag_3C = True
-        if "4C" in model_list:
-            flag_4C = True
-        if "Full" in model_list:
-            flag_Full = True
-
+    index = _get_index(base_dir, index)
+    model_names = index.models(model_list)
 
     list_run_time_labels = []
     list_run_time_scores = []
     list_run_time_colors = []
-    if flag_2C:
-        with open(os.path.join(os.path.abspath(base_dir), "Run Time", "2 Compartments", "run_time.json")) as f:
-            json_run_time_2C = json.load(f)
-        list_run_time_labels.append(json_run_time_2C["pred_label"])
-        list_run_time_scores.append(json_run_time_2C["score"])
-        list_run_time_colors.append("m")
-    if flag_3C:
-        with open(os.path.join(os.path.abspath(base_dir), "Run Time", "3 Compartments", "run_time.json")) as f:
-            json_run_time_3C = json.load(f)
-        list_run_time_labels.append(json_run_time_3C["pred_label"])
-        list_run_time_scores.append(json_run_time_3C["score"])
-        list_run_time_colors.append("g")
-    if flag_4C:
-        with open(os.path.join(os.path.abspath(base_dir), "Run Time", "4 Compartments", "run_time.json")) as f:
-            json_run_time_4C = json.load(f)
-        list_run_time_labels.append(json_run_time_4C["pred_label"])
-        list_run_time_scores.append(json_run_time_4C["score"])
-        list_run_time_colors.append("r")
-    if flag_Full:
-        with open(os.path.join(os.path.abspath(base_dir), "Run Time", "Full Model", "run_time.json")) as f:
-            json_run_time_Full = json.load(f)
-        list_run_time_labels.append(json_run_time_Full["pred_label"])
-        list_run_time_scores.append(json_run_time_Full["score"])
-        list_run_time_colors.append("b")
-
-    fig = plt.figure(figsize=(10, 7))
-    ax = plt.gca()
+    for model_name in model_names:
+        json_run_time = index.get("run_time", model_name)
+        if json_run_time is None:
+            continue
+        list_run_time_labels.append(json_run_time["pred_label"])
+        list_run_time_scores.append(json_run_time["score"])
+        list_run_time_colors.append(index.style(model_name)["color"])
+    if not list_run_time_scores:
+        raise ValueError("No results of Test 'RunTime' found in '{}'!".format(index.base_dir))
+
+    fig = Figure(figsize=(10, 7))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
 
     rects = ax.bar(list_run_time_labels, list_run_time_scores, width = 0.5, color = list_run_time_colors)
     for i, rect in enumerate(rects):
@@ -672,7 +317,7 @@ def create_fig_runtimes(base_dir=None, model_list=[]):
                 ha='center', va='bottom',
                 color=list_run_time_colors[i],
                 fontsize=14, fontweight='bold')
-   
+
     ax.set_title("Compare Run Times", {"fontsize": 20, "fontweight" : "bold"}, pad=25)
     ax.set_xlabel("Model", fontsize=18)
     ax.set_ylabel("Real time (s)", fontsize=18)
@@ -680,6 +325,40 @@ def create_fig_runtimes(base_dir=None, model_list=[]):
     ax.tick_params(axis='both', which='major', labelsize=14)
 
     fig.tight_layout(h_pad=5, w_pad=5)
-    filepath = os.path.join(os.path.abspath(base_dir), 'figure_runtimes.pdf')
-    plt.savefig(filepath, dpi=600, bbox_inches= "tight")
+    filepath = os.path.join(index.base_dir, 'figure_runtimes.pdf')
+    fig.savefig(filepath, dpi=600, bbox_inches= "tight")
     return filepath
+
+# ===============================================================================
+
+def create_summary_figures(base_dir=None, model_list=[]):
+    """Method to create all summary figures in a single pass over the results
+
+    The results under `base_dir` are loaded once (see :class:`ResultsIndex`)
+    and shared by :func:`create_fig7`, :func:`create_fig7_runtimes` and,
+    if Test 'RunTime' results exist, :func:`create_fig_runtimes`.
+
+     Parameters
+     ----------
+     base_dir : string
+         path to directory named 'validation_davison2000unit'
+     model_list : list
+         list of models to be plotted (2C, 3C, 4C, Full, or any other model name);
+         default is empty list and signifies all models
+
+     Returns
+     -------
+     list
+         The absolute paths of the generated PDF figures
+
+     Examples
+     --------
+     >>> figs = utils.create_summary_figures(base_dir = "./validation_davison2000unit")
+     """
+
+    index = ResultsIndex(base_dir)
+    filepaths = [create_fig7(model_list=model_list, index=index),
+                 create_fig7_runtimes(model_list=model_list, index=index)]
+    if index.results["run_time"]:
+        filepaths.append(create_fig_runtimes(model_list=model_list, index=index))
+    return filepaths
@@ -17,7 +17,7 @@ setup(
     version='0.1',
     author='Shailesh Appukuttan',
     author_email='shailesh.appukuttan@unic.cnrs-gif.fr',
-    packages=['davison2000unit', 'davison2000unit.tests', 'davison2000unit.capabilities', 'davison2000unit.scores', 'davison2000unit.plots'],
+    packages=['davison2000unit', 'davison2000unit.tests', 'davison2000unit.capabilities', 'davison2000unit.scores', 'davison2000unit.plots', 'davison2000unit.models'],
     url='https://github.com/appukuttan-shailesh/davison2000unit',
     license='BSD-3-Clause',
     description='A SciUnit library for testing of models from Davison et al. (2000)',
@@ -0,0 +1,77 @@
+"""Cross-checks the NumPy spike detector of davison2000unit.features against eFEL
+
+Run with ``python -m pytest tests``.
+"""
+
+import numpy
+import pytest
+from davison2000unit import features
+from davison2000unit.models import ReferenceMitralCell
+
+efel = pytest.importorskip("efel")
+
+# ===============================================================================
+
+AMPLITUDES = (0.0, 0.05, 0.2, 0.4, 0.8, 1.6)     # nA; the lowest do not elicit spikes
+STIM_START = 50.0   # ms
+STIM_END = 150.0    # ms
+TSTOP = 200.0       # ms
+
+# offsets (in ms) of the window edges from a spike peak, i.e. edges crossing the spike
+EDGE_OFFSETS = (-0.5, -0.2, 0.2, 0.5)
+
+
+@pytest.fixture(scope="module")
+def traces():
+    """Somatic Vm traces of the reference model, {amplitude: (t, v)}"""
+    model = ReferenceMitralCell(n_compartments=2)
+    model.inject_step_current_batch(site="soma", currents=[{"delay": STIM_START,
+                                                            "duration": STIM_END - STIM_START,
+                                                            "amplitude": amplitude}
+                                                           for amplitude in AMPLITUDES])
+    return dict(zip(AMPLITUDES, model.get_membrane_potential_soma_batch(tstop=TSTOP)))
+
+
+def windows(t, v):
+    """Returns the (stim_start, stim_end) windows checked for a trace: the
+    stimulus, the whole trace, and windows whose edges cross its spikes."""
+    result = [(STIM_START, STIM_END), (0.0, TSTOP), (STIM_END, TSTOP)]
+    peaks = features.spike_times(t, v)
+    for peak in peaks[:3].tolist() + peaks[-1:].tolist():
+        for offset in EDGE_OFFSETS:
+            result.append((peak + offset, STIM_END))
+            result.append((STIM_START, peak + offset))
+    return [(start, end) for start, end in result if end > start]
+
+
+@pytest.mark.parametrize("feature", features.FEATURES)
+@pytest.mark.parametrize("amplitude", AMPLITUDES)
+def test_matches_efel(traces, amplitude, feature):
+    t, v = traces[amplitude]
+    efel_traces = [{"T": t, "V": v, "stim_start": [start], "stim_end": [end]}
+                   for start, end in windows(t, v)]
+    efel.reset()
+    expected = []
+    for feature_values in efel.get_feature_values(efel_traces, [feature]):
+        value = feature_values[feature]
+        expected.append(None if value is None or len(value) == 0 else value[0])
+
+    values = features.get_feature_values(efel_traces, feature)
+    assert len(values) == len(expected)
+    for efel_trace, value, expected_value in zip(efel_traces, values, expected):
+        window = (efel_trace["stim_start"][0], efel_trace["stim_end"][0])
+        if expected_value is None:
+            assert value is None, window
+        elif feature == "time_to_first_spike" and expected_value < 0:
+            # eFEL times the first spike of the whole trace, even if it precedes
+            # stim_start, whereas features only considers spikes after stim_start
+            assert value is None or value > 0, window
+        else:
+            assert value == pytest.approx(expected_value, abs=1e-6), window
+
+
+def test_no_spikes(traces):
+    t, v = traces[0.0]
+    efel_trace = {"T": t, "V": v, "stim_start": [STIM_START], "stim_end": [STIM_END]}
+    assert features.get_feature_values([efel_trace], "Spikecount_stimint") == [0]
+    assert features.get_feature_values([efel_trace], "time_to_first_spike") == [None]